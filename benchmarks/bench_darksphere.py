@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Benchmark the Dark Sphere calendar extractor against the previous
+implementation (kept below as ``legacy_darksphere_events``).
+
+Both run on the same parsed tree; the script checks that they produce
+identical events and prints the time each one takes.  Pass saved copies of
+the calendar page to benchmark real markup, otherwise a synthetic calendar
+is generated:
+
+```
+python benchmarks/bench_darksphere.py                      # synthetic page
+python benchmarks/bench_darksphere.py saved/gamingcalendar.html
+python benchmarks/bench_darksphere.py --days 31 --depth 12 --repeat 5
+```
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from datetime import datetime
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import riftbound_watcher as rw  # noqa: E402
+
+
+def legacy_darksphere_events(soup, now):
+    events = []
+    # Determine the month being shown (e.g., “November”).  If not present,
+    # default to the current month.
+    month_el = soup.find(string=re.compile(r"^(January|February|March|April|May|June|July|August|September|October|November|December)$", re.I))
+    month_name = month_el.strip() if month_el else now.strftime("%B")
+    year = now.year
+    current_day = None
+    for node in soup.find_all(True):
+        # Dark Sphere marks days with headings like “9. Sunday”
+        if node.name in {"div", "p", "span", "h1", "h2", "h3", "h4"} and node.get_text(strip=True):
+            mday = re.match(r"^(\d{1,2})\.\s*[A-Za-z]+$", node.get_text(strip=True))
+            if mday:
+                current_day = int(mday.group(1))
+                continue
+        # Event links live in <a> elements with text containing “Riftbound”
+        if node.name == "a" and node.get_text(strip=True):
+            title = node.get_text(" ", strip=True)
+            if "riftbound" not in title.lower():
+                continue
+            # Look in nearby siblings for time information
+            time_text = ""
+            for sib in list(node.next_siblings)[:3]:
+                if hasattr(sib, "get_text"):
+                    time_text += " " + sib.get_text(" ", strip=True)
+                elif isinstance(sib, str):
+                    time_text += " " + sib.strip()
+            start_str, end_str = rw.parse_time_range(time_text)
+            if current_day is None:
+                # Walk backwards up to 10 elements to find a day header
+                prev = node
+                for _ in range(10):
+                    prev = prev.find_previous()
+                    if not prev:
+                        break
+                    txt = prev.get_text(" ", strip=True) if hasattr(prev, "get_text") else str(prev)
+                    mday2 = re.match(r"^(\d{1,2})\.\s*[A-Za-z]+$", txt)
+                    if mday2:
+                        current_day = int(mday2.group(1))
+                        break
+            if current_day is None:
+                continue
+            ev_date = rw.resolve_calendar_date(month_name, year, current_day)
+            if not ev_date:
+                continue
+            start_time = start_str or "19:00"
+            start_dt = rw.londonify(rw.dtparse.parse(f"{ev_date.isoformat()} {start_time}", dayfirst=False))
+            end_dt = rw.londonify(rw.dtparse.parse(f"{ev_date.isoformat()} {end_str}", dayfirst=False)) if end_str else rw.guess_end(start_dt, 4)
+            events.append(rw.RBEvent(
+                title=title,
+                start=start_dt,
+                end=end_dt,
+                url=rw.requests.compat.urljoin(rw.DARKSPHERE_URL, node.get("href", "")),
+                store="Dark Sphere (Shepherd's Bush)",
+                location="Shepherd's Bush Megastore, London",
+            ))
+    return events
+
+
+def synthetic_calendar(days: int, depth: int, per_day: int) -> str:
+    """A month of days, each nested ``depth`` divs deep with ``per_day`` events."""
+    cells = []
+    for day in range(1, days + 1):
+        weekday = datetime(2025, 11, min(day, 30)).strftime("%A")
+        items = []
+        for i in range(per_day):
+            game = "Riftbound Nexus Night" if i % 3 == 0 else f"Board Game Club {i}"
+            items.append(
+                f'<div class="ev"><a href="event.php?id={day * 100 + i}">{game}</a>'
+                f' <span>{18 + i % 3}:00 - 22:00</span> <small>Tickets £5</small></div>'
+            )
+        inner = f"<div class=\"day\">{day}. {weekday}</div>" + "".join(items)
+        for _ in range(depth):
+            inner = f"<div class=\"wrap\">{inner}</div>"
+        cells.append(f"<td>{inner}</td>")
+    rows = "".join(f"<tr>{''.join(cells[i:i + 7])}</tr>" for i in range(0, len(cells), 7))
+    return f"<html><body><h2>November</h2><table>{rows}</table></body></html>"
+
+
+def timed(fn, soup, now, repeat: int):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(soup, now)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("pages", nargs="*", help="Saved calendar HTML files")
+    ap.add_argument("--days", type=int, default=31)
+    ap.add_argument("--depth", type=int, default=8, help="Nesting depth of each day (synthetic page)")
+    ap.add_argument("--per-day", type=int, default=6, help="Events per day (synthetic page)")
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    now = rw.londonify(datetime(2025, 11, 1, 12, 0))
+    if args.pages:
+        docs = [(path, open(path, encoding="utf-8").read()) for path in args.pages]
+    else:
+        docs = [(f"synthetic days={args.days} depth={args.depth}", synthetic_calendar(args.days, args.depth, args.per_day))]
+
+    ok = True
+    for name, html in docs:
+        soup = BeautifulSoup(html, "html.parser")
+        t_old, old = timed(legacy_darksphere_events, soup, now, args.repeat)
+        t_new, new = timed(rw._darksphere_events, soup, now, args.repeat)
+        same = [e.to_dict() for e in old] == [e.to_dict() for e in new]
+        ok = ok and same
+        print(f"{name}: {len(new)} events, legacy {t_old * 1000:.1f} ms, "
+              f"current {t_new * 1000:.1f} ms ({t_old / t_new:.1f}x), identical={same}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
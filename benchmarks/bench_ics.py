@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Compare the streaming .ics writer (``riftbound_watcher.ics_lines``) with the
+``ics`` package writer it replaced, on a large synthetic set of events.
+
+For each writer the script reports write time and peak traced memory, then
+reads both files back with the ``ics`` package and checks they describe the
+same events (UID, summary, start, end, location, URL).  It also writes the
+native calendar twice and checks the bytes are identical.  Needs the ``ics``
+package:
+
+```
+python benchmarks/bench_ics.py
+python benchmarks/bench_ics.py --events 20000 --repeat 5
+```
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+import ics
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import riftbound_watcher as rw  # noqa: E402
+
+STORES = [
+    ("Dark Sphere (Shepherd's Bush)", "Shepherd's Bush Megastore, London"),
+    ("Zombie Games Café (Cricklewood)", "Zombie Games Café, London"),
+    ("Europa Gaming (Wembley)", "Europa Gaming, Wembley"),
+    ("Spellbound Games (London)", None),
+]
+TITLES = [
+    "Riftbound Nexus Night",
+    "Riftbound Summoner Skirmish – Origins, round {i}; bring a deck",
+    "Riftbound Release Event: Spiritforged (sealed) \\ midnight launch with prizes for the top eight players",
+    "Riftbound League",
+]
+
+
+def synthetic_events(n: int, seed: int = 1) -> list:
+    rnd = random.Random(seed)
+    events = []
+    for i in range(n):
+        store, location = STORES[i % len(STORES)]
+        start = datetime(2026, 1, 1, rnd.choice([11, 14, 18, 19])) + timedelta(days=i // 4)
+        end = start + timedelta(hours=rnd.choice([2, 3, 4])) if i % 5 else None
+        events.append(rw.RBEvent(
+            title=rnd.choice(TITLES).format(i=i),
+            start=rw.londonify(start),
+            end=rw.londonify(end) if end else None,
+            url=f"https://example.local/events/{i}",
+            store=store,
+            location=location,
+        ))
+    return events
+
+
+def measure(write, events, path: str, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        write(events, path)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    write(events, path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def read_back(path: str) -> list:
+    with open(path, encoding="utf-8") as f:
+        cal = ics.Calendar(f.read())
+    return sorted(
+        (e.uid, e.name, e.begin.datetime, e.end.datetime if e.end else None, e.location, e.url)
+        for e in cal.events
+    )
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--events", type=int, default=5000, help="Number of synthetic events")
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    events = synthetic_events(args.events)
+    tmp = tempfile.mkdtemp()
+    native_path = os.path.join(tmp, "native.ics")
+    package_path = os.path.join(tmp, "package.ics")
+    t_native, m_native = measure(lambda evs, p: rw.export_ics(evs, p, writer="native"), events, native_path, args.repeat)
+    with open(native_path, "rb") as f:
+        first = f.read()
+    t_pkg, m_pkg = measure(lambda evs, p: rw.export_ics(evs, p, writer="ics"), events, package_path, args.repeat)
+    rw.export_ics(list(reversed(events)), native_path, writer="native")
+    with open(native_path, "rb") as f:
+        stable = f.read() == first
+
+    same = read_back(native_path) == read_back(package_path)
+    print(f"{len(events)} events:")
+    print(f"  native writer  {t_native * 1000:8.1f} ms  peak {m_native / 1024:8.0f} KiB")
+    print(f"  ics package    {t_pkg * 1000:8.1f} ms  peak {m_pkg / 1024:8.0f} KiB")
+    print(f"  same events: {same}; byte-stable: {stable}")
+    return 0 if same and stable else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
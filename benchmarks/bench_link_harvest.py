@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Compare a full parse of a hub page with the links‑only parse used for link
+harvesting (``riftbound_watcher._parse_links``).
+
+For each page the script reports parse time and peak traced memory for
+both modes, and checks that the Zombie, Europa and Shopify link
+extractors find the same links either way.  Pass saved hub pages, or
+nothing to use a synthetic Wix‑style page:
+
+```
+python benchmarks/bench_link_harvest.py saved/zombie-hub.html saved/europa-home.html
+python benchmarks/bench_link_harvest.py --links 400 --filler 200
+```
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import riftbound_watcher as rw  # noqa: E402
+
+EXTRACTORS = {
+    "zombie": rw._zombie_collect_product_links,
+    "europa": rw._europa_collect_event_links,
+    "shopify": lambda soup: rw._shopify_candidates(soup, rw.SPELLBOUND_COLLECTION, 2025),
+}
+
+
+def synthetic_hub(links: int, filler: int) -> str:
+    """Lots of nested layout markup, inline styles and scripts around a few links."""
+    blocks = []
+    for i in range(links):
+        game = "Riftbound Nexus Night" if i % 4 == 0 else f"Pokemon League {i}"
+        slug = game.lower().replace(" ", "-")
+        layout = "".join(
+            f'<div class="comp-{i}-{j}" style="width:{j}px;height:{j}px" data-testid="x{j}"><span>&nbsp;</span></div>'
+            for j in range(filler // 20)
+        )
+        blocks.append(
+            f'<section class="product">{layout}'
+            f'<a href="/product-page/{slug}-{i}"><img src="/i/{i}.png"><span>{game}</span></a>'
+            f'<a href="/event-details-registration/{slug}-{i}">{game} tickets</a>'
+            f'<a href="/products/{slug}-{i}">{game} 20/11/2025</a></section>'
+        )
+    script = "<script>" + "var x=1;" * filler + "</script>"
+    return f"<html><head>{script}</head><body>{''.join(blocks)}</body></html>"
+
+
+def measure(parse, html: str, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(html)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    soup = parse(html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, soup
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("pages", nargs="*", help="Saved hub pages")
+    ap.add_argument("--links", type=int, default=200, help="Products on the synthetic page")
+    ap.add_argument("--filler", type=int, default=200, help="Layout noise per product on the synthetic page")
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    if args.pages:
+        docs = [(path, open(path, encoding="utf-8").read()) for path in args.pages]
+    else:
+        docs = [(f"synthetic links={args.links} filler={args.filler}", synthetic_hub(args.links, args.filler))]
+
+    ok = True
+    print(f"parser backend: {rw.PARSER}")
+    for name, html in docs:
+        t_full, m_full, full = measure(rw._parse, html, args.repeat)
+        t_links, m_links, links = measure(rw._parse_links, html, args.repeat)
+        same = all(fn(full) == fn(links) for fn in EXTRACTORS.values())
+        ok = ok and same
+        print(f"{name} ({len(html) / 1024:.0f} KiB):")
+        print(f"  full parse   {t_full * 1000:8.1f} ms  peak {m_full / 1024:8.0f} KiB")
+        print(f"  links only   {t_links * 1000:8.1f} ms  peak {m_links / 1024:8.0f} KiB")
+        print(f"  same links: {same}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Check that every extractor gives the same answer on every HTML parser
+backend, and time each backend.
+
+Each saved page is parsed with every installed backend and run through all
+of the scrapers' extractors (an extractor that doesn't apply to a page just
+finds nothing).  Results are compared against html.parser.  With no pages
+the script runs on the synthetic fixtures in ``benchmarks/fixtures/``, one
+per extractor, and also checks that each fixture's own extractor finds
+something:
+
+```
+python benchmarks/parser_parity.py
+python benchmarks/parser_parity.py saved/*.html
+python benchmarks/parser_parity.py --repeat 10 saved/gamingcalendar.html
+```
+
+Exits non‑zero if any backend disagrees.
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+
+from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import riftbound_watcher as rw  # noqa: E402
+
+NOW = rw.londonify(datetime(2025, 11, 1, 12, 0))
+PAGE_URL = "https://example.local/page"
+
+EXTRACTORS = {
+    "darksphere": lambda soup: [e.to_dict() for e in rw._darksphere_events(soup, NOW)],
+    "shopify hub": lambda soup: rw._shopify_candidates(soup, rw.SPELLBOUND_COLLECTION, NOW.year),
+    "shopify product": lambda soup: rw._shopify_product_details(soup, NOW.year),
+    "zombie hub": rw._zombie_collect_product_links,
+    "zombie product": lambda soup: rw._zombie_product_detail(soup, PAGE_URL, NOW.year),
+    "europa home": rw._europa_collect_event_links,
+    "europa event": lambda soup: rw._europa_event_detail(soup, PAGE_URL, NOW.year),
+}
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+# Fixture file -> the extractor it was written for.
+FIXTURES = {
+    "darksphere_calendar.html": "darksphere",
+    "shopify_hub.html": "shopify hub",
+    "shopify_product.html": "shopify product",
+    "zombie_hub.html": "zombie hub",
+    "zombie_product.html": "zombie product",
+    "europa_home.html": "europa home",
+    "europa_event.html": "europa event",
+}
+
+
+def _found(value) -> bool:
+    """True if an extractor's result holds anything beyond the page title."""
+    if isinstance(value, rw.ProductDetail):
+        return value.date is not None or value.start is not None
+    return bool(value)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("pages", nargs="*", help="Saved HTML pages (default: the bundled fixtures)")
+    ap.add_argument("--repeat", type=int, default=3, help="Parses per backend when timing")
+    args = ap.parse_args()
+
+    backends = [b for b in rw.PARSER_BACKENDS if builder_registry.lookup(b) is not None]
+    print(f"backends: {', '.join(backends)}")
+    pages = args.pages or [os.path.join(FIXTURE_DIR, name) for name in FIXTURES]
+    ok = True
+    for path in pages:
+        with open(path, encoding="utf-8") as f:
+            html = f.read()
+        reference = None
+        timings = []
+        for backend in backends:
+            best = float("inf")
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                soup = BeautifulSoup(html, backend)
+                best = min(best, time.perf_counter() - start)
+            timings.append(f"{backend} {best * 1000:.1f} ms")
+            results = {name: fn(soup) for name, fn in EXTRACTORS.items()}
+            if reference is None:
+                reference = results
+                continue
+            for name, value in results.items():
+                if value != reference[name]:
+                    ok = False
+                    print(f"  MISMATCH {path} [{name}] {backend}: {value!r} != html.parser: {reference[name]!r}")
+        expected = FIXTURES.get(os.path.basename(path)) if not args.pages else None
+        if expected and not _found(reference[expected]):
+            ok = False
+            print(f"  EMPTY {path}: the {expected} extractor found nothing")
+        print(f"{path}: parse {', '.join(timings)}")
+    print("all backends agree" if ok else "backends disagree")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
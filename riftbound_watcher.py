@@ -24,7 +24,7 @@ Usage example:
 
 ```
 python -m venv .venv && . .venv/bin/activate
-pip install requests beautifulsoup4 python-dateutil pytz ics python-slugify
+pip install requests beautifulsoup4 python-dateutil pytz python-slugify
 
 # run immediately (set DISCORD_WEBHOOK_URL in your environment first)
 DISCORD_WEBHOOK_URL="https://discord.com/api/webhooks/..." python riftbound_watcher_fixed.py run
@@ -39,21 +39,96 @@ runner.  For an example GitHub workflow, see the README in your repo.
 """
 
 from __future__ import annotations
+import importlib
+import time
+
+# For --startup-profile, the modules imported at the top level are first
+# imported one by one here and timed (wall clock); the import statements
+# below then find them already loaded.  ``python -X importtime`` gives the
+# full tree, including what each of these pulls in.
+_STARTED = time.perf_counter()
+IMPORT_TIMES: dict = {}
+_TOP_LEVEL_IMPORTS = (
+    "os", "re", "json", "hashlib", "argparse", "calendar", "random", "signal", "sqlite3", "threading",
+    "collections", "concurrent.futures", "contextlib", "dataclasses", "functools", "itertools",
+    "datetime", "email.utils", "typing", "urllib.parse", "fcntl", "pytz",
+)
+for _name in _TOP_LEVEL_IMPORTS:
+    _began = time.perf_counter()
+    try:
+        importlib.import_module(_name)
+    except ImportError:
+        pass  # fcntl is optional; anything else fails again below
+    finally:
+        IMPORT_TIMES[_name] = time.perf_counter() - _began
+del _name, _began
+
 import os
 import re
 import json
 import hashlib
 import argparse
 import calendar
+import random
+import signal
+import sqlite3
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, asdict
-from datetime import datetime, date, timedelta
-from typing import List, Optional, Tuple
-
+from functools import lru_cache
+from itertools import islice
+from datetime import datetime, date, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Set, Tuple
+from urllib.parse import urlsplit, urlunsplit
+
+try:  # advisory state lock; not available on Windows
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# pytz stays eager: every subcommand starts by taking the time in London, so
+# deferring it would only move its cost, not save it.
 import pytz
-import requests
-from bs4 import BeautifulSoup
-from dateutil import parser as dtparse
-from ics import Calendar, Event as IcsEvent
+
+
+class _LazyModule:
+    """
+    Stand‑in for a module that imports it on first attribute access, so each
+    subcommand only pays for the dependencies it actually uses (``export
+    --from-db`` never loads requests or bs4; ``run`` never loads ics).  The
+    time each import took is kept in IMPORT_TIMES for --startup-profile.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr: str) -> Any:
+        module = self._module
+        if module is None:
+            module = self._load()
+        return getattr(module, attr)
+
+    def _load(self):
+        with _IMPORT_LOCK:
+            if self._module is None:
+                started = time.perf_counter()
+                self._module = importlib.import_module(self._name)
+                IMPORT_TIMES[self._name] = time.perf_counter() - started
+        return self._module
+
+
+_IMPORT_LOCK = threading.Lock()
+
+asyncio = _LazyModule("asyncio")
+requests = _LazyModule("requests")
+bs4 = _LazyModule("bs4")
+dtparse = _LazyModule("dateutil.parser")
+ics = _LazyModule("ics")
+LAZY_MODULES = (requests, bs4, dtparse, asyncio, ics)
 
 LONDON_TZ = pytz.timezone("Europe/London")
 HEADERS = {"User-Agent": "RiftboundWatcher/1.5 (+https://example.local)"}
@@ -119,6 +194,18 @@ class RBEvent:
         d["end"] = self.end.isoformat() if self.end else None
         return d
 
+    @classmethod
+    def from_dict(cls, d: dict) -> "RBEvent":
+        """Inverse of ``to_dict``."""
+        return cls(
+            title=d["title"],
+            start=londonify(datetime.fromisoformat(d["start"])),
+            end=londonify(datetime.fromisoformat(d["end"])) if d.get("end") else None,
+            url=d["url"],
+            store=d["store"],
+            location=d.get("location"),
+        )
+
 
 # ---------------------------------------------------------------------------
 # State persistence
@@ -127,21 +214,297 @@ def ensure_dirs() -> None:
     os.makedirs(DATA_DIR, exist_ok=True)
 
 
-def load_state() -> set:
-    """Load the set of seen event IDs from disk."""
+def _fsync_dir(path: str) -> None:
+    """Flush a directory entry (e.g. after a rename) where the platform allows it."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _atomic_write(path: str, text: str) -> None:
+    """
+    Replace ``path`` with ``text`` so a crash leaves either the old or the new
+    file, never a truncated one: write a temporary file, fsync it, rename it
+    over ``path`` and fsync the directory.
+    """
     ensure_dirs()
-    if not os.path.exists(STATE_PATH):
-        return set()
-    with open(STATE_PATH, "r", encoding="utf-8") as f:
-        raw = json.load(f)
-    return set(raw) if isinstance(raw, list) else set()
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    _fsync_dir(os.path.dirname(os.path.abspath(path)))
+
+
+# Runs hold an advisory lock on LOCK_PATH from load_state to the last save, so
+# overlapping invocations (e.g. a slow cron run and the next one) can't
+# interleave writes or post the same event twice.  A second run waits up to
+# --lock-wait / RIFTBOUND_LOCK_WAIT seconds (default 0) and then gives up.
+# Locking needs fcntl; where it is missing runs proceed unlocked.
+LOCK_PATH = os.path.join(DATA_DIR, "riftbound.lock")
+LOCK_WAIT = float(os.environ.get("RIFTBOUND_LOCK_WAIT", "0"))
+LOCK_POLL = 0.5
+
+
+class StateLocked(RuntimeError):
+    """Another run holds the state lock."""
+
+
+@contextmanager
+def state_lock(wait: Optional[float] = None):
+    """Hold the state lock, waiting up to ``wait`` seconds for it (default LOCK_WAIT)."""
+    if fcntl is None:
+        yield
+        return
+    ensure_dirs()
+    deadline = time.monotonic() + (LOCK_WAIT if wait is None else wait)
+    with open(LOCK_PATH, "a+") as f:
+        while True:
+            try:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise StateLocked(f"{LOCK_PATH} is held by another run")
+                time.sleep(min(LOCK_POLL, remaining))
+        f.seek(0)
+        f.truncate()
+        f.write(f"{os.getpid()}\n")
+        f.flush()
+        try:
+            yield
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
 
 
-def save_state(seen: set) -> None:
-    """Persist the set of seen event IDs to disk."""
+# Seen IDs live in an append‑only journal, one ``<id>\t<event start>`` line
+# per ID: each run appends only the IDs it discovered or whose start time it
+# refreshed (the last line for an ID wins).  The journal is rewritten
+# (compacted, sorted, via a temporary file and rename) only when IDs have been
+# dropped or it has collected too many superseded lines.  A legacy STATE_PATH
+# JSON list is migrated into the journal the first time it is loaded.
+#
+# Entries whose event started more than STATE_HORIZON ago are pruned each
+# run; find_events never returns events that old, so they can't re‑post.
+# IDs with no recorded start (legacy state) are stamped with the time they
+# were loaded, so they expire one horizon later unless re‑scraped.
+JOURNAL_PATH = os.path.join(DATA_DIR, "state.log")
+COMPACT_MIN_WASTE = 100
+STATE_HORIZON = timedelta(days=float(os.environ.get("RIFTBOUND_STATE_HORIZON_DAYS", "14")))
+_JOURNALED: dict = {}
+_JOURNAL_LINES = 0
+
+
+def _write_journal(seen: dict) -> None:
+    """Atomically replace the journal with ``seen`` (sorted, one ID per line)."""
+    global _JOURNALED, _JOURNAL_LINES
+    _atomic_write(JOURNAL_PATH, "".join(f"{i}\t{seen[i].isoformat()}\n" for i in sorted(seen)))
+    _JOURNALED, _JOURNAL_LINES = dict(seen), len(seen)
+
+
+def load_state() -> dict:
+    """Load seen event IDs from disk, mapped to the start time of their event."""
+    global _JOURNALED, _JOURNAL_LINES
     ensure_dirs()
-    with open(STATE_PATH, "w", encoding="utf-8") as f:
-        json.dump(sorted(list(seen)), f, indent=2)
+    loaded_at = londonify(datetime.now(tz=LONDON_TZ))
+    if not os.path.exists(JOURNAL_PATH):
+        seen: dict = {}
+        if os.path.exists(STATE_PATH):
+            with open(STATE_PATH, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+            seen = dict.fromkeys(raw, loaded_at) if isinstance(raw, list) else {}
+            _write_journal(seen)
+            os.remove(STATE_PATH)
+        else:
+            _JOURNALED, _JOURNAL_LINES = {}, 0
+        return seen
+    seen = {}
+    journaled = {}
+    lines = 0
+    with open(JOURNAL_PATH, "r", encoding="utf-8") as f:
+        for line in f:
+            uid, _, start = line.strip().partition("\t")
+            if not uid:
+                continue
+            lines += 1
+            try:
+                seen[uid] = journaled[uid] = datetime.fromisoformat(start)
+            except ValueError:
+                # untimed legacy line: left out of _JOURNALED so it is rewritten with the stamp
+                seen[uid] = loaded_at
+                journaled.pop(uid, None)
+    _JOURNALED, _JOURNAL_LINES = journaled, lines
+    return seen
+
+
+def prune_state(seen: dict, now: datetime, horizon: timedelta = None) -> int:
+    """Drop IDs for events that started before ``now - horizon``; return how many."""
+    cutoff = now - (STATE_HORIZON if horizon is None else horizon)
+    expired = [uid for uid, start in seen.items() if start < cutoff]
+    for uid in expired:
+        del seen[uid]
+    return len(expired)
+
+
+def save_state(seen: dict) -> None:
+    """Persist seen event IDs and their start times to disk."""
+    global _JOURNAL_LINES
+    ensure_dirs()
+    waste = _JOURNAL_LINES - len(_JOURNALED)
+    if _JOURNALED.keys() - seen.keys() or waste >= max(COMPACT_MIN_WASTE, len(seen) // 4):
+        _write_journal(seen)
+        return
+    changed = sorted(uid for uid, start in seen.items() if _JOURNALED.get(uid) != start)
+    if not changed:
+        return
+    with open(JOURNAL_PATH, "a", encoding="utf-8") as f:
+        f.writelines(f"{uid}\t{seen[uid].isoformat()}\n" for uid in changed)
+        f.flush()
+        os.fsync(f.fileno())
+    _JOURNALED.update((uid, seen[uid]) for uid in changed)
+    _JOURNAL_LINES += len(changed)
+
+
+# ---------------------------------------------------------------------------
+# Event store
+#
+# Alongside the seen‑ID journal, every scraped event is kept as a full row in
+# an SQLite database (RIFTBOUND_DB, default .data/events.sqlite3), keyed by
+# uid() and indexed by stable_id() and (store, start).  Times are stored in
+# UTC so they sort correctly across clock changes.  Each run writes all of
+# its rows in one transaction.  Upcoming rows of a store whose source was
+# scraped in full (no failure, no page skipped) but are missing from that
+# scrape (renamed or cancelled events) are deleted, so ``upcoming`` only
+# returns what the sites list now.
+
+EVENT_DB_PATH = os.environ.get("RIFTBOUND_DB") or os.path.join(DATA_DIR, "events.sqlite3")
+
+_EVENT_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    uid        TEXT PRIMARY KEY,
+    stable_id  TEXT NOT NULL,
+    store      TEXT NOT NULL,
+    title      TEXT NOT NULL,
+    start      TEXT NOT NULL,
+    end        TEXT,
+    url        TEXT,
+    location   TEXT,
+    first_seen TEXT NOT NULL,
+    last_seen  TEXT NOT NULL,
+    notified   INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS events_stable_id ON events (stable_id);
+CREATE INDEX IF NOT EXISTS events_store_start ON events (store, start);
+"""
+
+
+def _utc_iso(dt: Optional[datetime]) -> Optional[str]:
+    return dt.astimezone(timezone.utc).isoformat() if dt else None
+
+
+class EventStore:
+    """SQLite table of every event seen, with a flag for those already announced."""
+
+    def __init__(self, path: str = None) -> None:
+        self.path = path or EVENT_DB_PATH
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_EVENT_SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def is_notified(self, ev: RBEvent) -> bool:
+        """True if this event (by uid or stable_id) has already been announced."""
+        row = self.conn.execute(
+            "SELECT 1 FROM events WHERE notified = 1 AND (uid = ? OR stable_id = ?) LIMIT 1",
+            (ev.uid(), ev.stable_id()),
+        ).fetchone()
+        return row is not None
+
+    def record(self, events: List[RBEvent], now: datetime, notified: List[RBEvent] = (),
+               scraped: Iterable[str] = ()) -> None:
+        """
+        Upsert ``events`` and ``notified`` and flag the latter, in a single
+        transaction.  Rows of the ``scraped`` stores starting from yesterday
+        onwards that aren't in ``events`` are deleted.
+        """
+        seen_at = _utc_iso(now)
+        announced = {ev.uid() for ev in notified}
+        rows = [
+            (ev.uid(), ev.stable_id(), ev.store, ev.title, _utc_iso(ev.start), _utc_iso(ev.end),
+             ev.url, ev.location, seen_at, seen_at, 1 if ev.uid() in announced else 0)
+            for ev in {ev.uid(): ev for ev in (*events, *notified)}.values()
+        ]
+        with self.conn:
+            self.conn.executemany(
+                """
+                INSERT INTO events (uid, stable_id, store, title, start, end, url, location,
+                                    first_seen, last_seen, notified)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (uid) DO UPDATE SET
+                    end = excluded.end,
+                    url = excluded.url,
+                    location = excluded.location,
+                    last_seen = excluded.last_seen,
+                    notified = MAX(notified, excluded.notified)
+                """,
+                rows,
+            )
+            retired = self.conn.executemany(
+                "DELETE FROM events WHERE store = ? AND start >= ? AND last_seen < ?",
+                [(name, _utc_iso(now - timedelta(days=1)), seen_at) for name in sorted(set(scraped))],
+            ).rowcount
+        if retired > 0:
+            print(f"[db] {retired} events no longer listed removed")
+
+    def first_seen(self, events: List[RBEvent]) -> dict:
+        """Map the stable_id() of each of ``events`` the store knows to when it was first seen."""
+        ids = list({ev.stable_id() for ev in events})
+        found = {}
+        for i in range(0, len(ids), 500):  # stay under SQLite's bound-parameter limit
+            chunk = ids[i:i + 500]
+            rows = self.conn.execute(
+                f"SELECT stable_id, MIN(first_seen) FROM events WHERE stable_id IN ({','.join('?' * len(chunk))}) "
+                "GROUP BY stable_id",
+                chunk,
+            )
+            found.update((sid, datetime.fromisoformat(seen)) for sid, seen in rows)
+        return found
+
+    def upcoming(self, since: datetime) -> List[RBEvent]:
+        """Events starting at or after ``since``, one per store and start time."""
+        rows = self.conn.execute(
+            """
+            SELECT title, start, end, url, store, location FROM events
+            WHERE start >= ?
+            ORDER BY start, store, last_seen DESC
+            """,
+            (_utc_iso(since),),
+        ).fetchall()
+        events = [
+            RBEvent(
+                title=title,
+                start=londonify(datetime.fromisoformat(start)),
+                end=londonify(datetime.fromisoformat(end)) if end else None,
+                url=url,
+                store=store,
+                location=location,
+            )
+            for title, start, end, url, store, location in rows
+        ]
+        return _dedup_slot_conflicts(events)
 
 
 # ---------------------------------------------------------------------------
@@ -159,6 +522,56 @@ def guess_end(start: datetime, hours: int = 3) -> datetime:
     return start + timedelta(hours=hours)
 
 
+# Times scraped from pages are nearly always "HH:MM" or "H:MM[am|pm]", which
+# we can turn into a datetime directly instead of running dateutil.  The
+# counters show how often the slow (dateutil) paths are still taken.
+_CLOCK_RE = re.compile(r"^\s*(\d{1,2}):(\d{2})\s*(am|pm)?\s*$", re.I)
+_MONTH_NUMBERS = {name.lower(): i for i, name in enumerate(calendar.month_name) if name}
+DATE_STATS = {"fast": 0, "slow": 0}
+_DATE_STATS_LOCK = threading.Lock()
+
+
+def _count_date(path: str) -> None:
+    with _DATE_STATS_LOCK:
+        DATE_STATS[path] += 1
+
+
+def at_time(day: date, clock: str) -> datetime:
+    """
+    Return ``day`` at wall‑clock time ``clock`` (e.g. "19:00" or "6:30pm")
+    in London.  Anything other than the usual formats is handed to dateutil.
+    """
+    m = _CLOCK_RE.match(clock)
+    if m:
+        hour, minute, meridiem = int(m.group(1)), int(m.group(2)), (m.group(3) or "").lower()
+        if meridiem and 1 <= hour <= 12:
+            hour = hour % 12 + (12 if meridiem == "pm" else 0)
+            meridiem = ""
+        if not meridiem and hour < 24 and minute < 60:
+            _count_date("fast")
+            return londonify(datetime(day.year, day.month, day.day, hour, minute))
+    _count_date("slow")
+    return londonify(dtparse.parse(f"{day.isoformat()} {clock}", dayfirst=False))
+
+
+@lru_cache(maxsize=4096)
+def _fuzzy_date(text: str, default_year: int) -> Optional[date]:
+    """dateutil's fuzzy parse of ``text``, memoised (``text`` is pre‑normalised)."""
+    try:
+        dt = dtparse.parse(text, dayfirst=True, fuzzy=True, default=datetime(default_year, 1, 1))
+        return date(dt.year, dt.month, dt.day)
+    except Exception:
+        return None
+
+
+def report_date_stats() -> None:
+    info = _fuzzy_date.cache_info()
+    print(
+        f"[dates] {DATE_STATS['fast']} fast, {DATE_STATS['slow']} via dateutil; "
+        f"fuzzy dates {info.hits} cached, {info.misses} parsed"
+    )
+
+
 def resolve_calendar_date(month_name: str, year: int, day: int) -> Optional[date]:
     """
     Dark Sphere sometimes lists day numbers that really belong to the next
@@ -166,10 +579,12 @@ def resolve_calendar_date(month_name: str, year: int, day: int) -> Optional[date
     first tries to construct a date with the given month and day; if that
     fails, it rolls over into the following month.
     """
-    try:
-        month = dtparse.parse(month_name).month
-    except Exception:
-        month = 1
+    month = _MONTH_NUMBERS.get(month_name.strip().lower())
+    if month is None:
+        try:
+            month = dtparse.parse(month_name).month
+        except Exception:
+            month = 1
     # Try the given month first
     try:
         return date(year, month, day)
@@ -187,49 +602,1163 @@ def resolve_calendar_date(month_name: str, year: int, day: int) -> Optional[date
 
 
 # ---------------------------------------------------------------------------
-# Discord notification
-
-def post_discord(event: RBEvent) -> None:
+# Shared HTTP session
+#
+# Every request (scrapers and Discord alike) goes through one pooled
+# ``requests.Session`` so repeat visits to the same host reuse a kept‑alive
+# connection instead of paying a fresh TCP/TLS handshake.  At most
+# HTTP_POOL_PER_HOST connections are opened to any one host; further requests
+# wait for a free connection.
+
+HTTP_POOL_HOSTS = int(os.environ.get("RIFTBOUND_POOL_HOSTS", "16"))
+HTTP_POOL_PER_HOST = int(os.environ.get("RIFTBOUND_POOL_PER_HOST", "4"))
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def http_session() -> requests.Session:
+    """Return the process‑wide pooled session, creating it on first use."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=HTTP_POOL_HOSTS,
+                pool_maxsize=HTTP_POOL_PER_HOST,
+                pool_block=True,
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update(HEADERS)
+            _SESSION = session
+        return _SESSION
+
+
+def http_stats() -> dict:
     """
-    Post a single event to Discord using the webhook URL in the
-    ``DISCORD_WEBHOOK_URL`` environment variable.  If no webhook is set,
-    nothing is posted.
+    Return request and connection counters for the shared session, summed
+    over every host pool: ``requests`` sent, ``connections`` opened and
+    ``reused`` (requests that rode on an already‑open connection).
     """
-    webhook = os.environ.get("DISCORD_WEBHOOK_URL")
-    if not webhook:
-        return
-    tag = _op_tag_for(event.title)
-    header = f"**{tag}**\n" if tag else ""
-    content = (
-        f"{header}"
-        f"**New Riftbound event — {event.store}!**\n"
-        f"**{event.title}**\n"
-        f"🗓️ {event.start.strftime('%a %d %b %Y %H:%M')}"
-    )
+    totals = {"requests": 0, "connections": 0}
+    if _SESSION is not None:
+        for adapter in {id(a): a for a in _SESSION.adapters.values()}.values():
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                try:
+                    pool = pools[key]
+                except KeyError:
+                    continue
+                totals["requests"] += pool.num_requests
+                totals["connections"] += pool.num_connections
+    totals["reused"] = max(0, totals["requests"] - totals["connections"])
+    return totals
+
+
+# ---------------------------------------------------------------------------
+# Discord notification
+
+# New events are posted as embeds, packed into as few webhook messages as
+# Discord allows: at most DISCORD_MAX_EMBEDS embeds and DISCORD_MAX_CHARS
+# characters of embed text per message.
+DISCORD_MAX_EMBEDS = 10
+DISCORD_MAX_CHARS = 6000
+DISCORD_TITLE_LIMIT = 256
+DISCORD_COLOUR = 0x8E44AD
+
+
+def _discord_embed(event: RBEvent) -> dict:
+    """Build the Discord embed for one event."""
+    when = f"🗓️ {event.start.strftime('%a %d %b %Y %H:%M')}"
     if event.end:
-        content += f" – {event.end.strftime('%H:%M')}"
+        when += f" – {event.end.strftime('%H:%M')}"
+    lines = [when]
     if event.location:
-        content += f"\n📍 {event.location}"
+        lines.append(f"📍 {event.location}")
+    embed = {
+        "title": event.title[:DISCORD_TITLE_LIMIT],
+        "description": "\n".join(lines),
+        "footer": {"text": event.store},
+        "timestamp": event.start.astimezone(timezone.utc).isoformat(),
+        "color": DISCORD_COLOUR,
+    }
     if event.url:
-        content += f"\n🔗 {event.url}"
+        embed["url"] = event.url
+    tag = _op_tag_for(event.title)
+    if tag:
+        embed["author"] = {"name": tag}
+    return embed
+
+
+def _embed_chars(embed: dict) -> int:
+    """Characters of an embed that count towards Discord's per‑message limit."""
+    return (
+        len(embed.get("title", ""))
+        + len(embed.get("description", ""))
+        + len(embed.get("footer", {}).get("text", ""))
+        + len(embed.get("author", {}).get("name", ""))
+    )
+
+
+def _discord_batches(events: List[RBEvent]) -> List[List[Tuple[RBEvent, dict]]]:
+    """Pair events with their embeds, split into messages that respect the limits."""
+    batches: List[List[Tuple[RBEvent, dict]]] = []
+    batch: List[Tuple[RBEvent, dict]] = []
+    chars = 0
+    for event in events:
+        embed = _discord_embed(event)
+        size = _embed_chars(embed)
+        if batch and (len(batch) == DISCORD_MAX_EMBEDS or chars + size > DISCORD_MAX_CHARS):
+            batches.append(batch)
+            batch, chars = [], 0
+        batch.append((event, embed))
+        chars += size
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+# Discord reports each webhook's rate limit in X‑RateLimit‑* headers; when a
+# response says the bucket is empty, the next message to that webhook waits
+# for it to reset instead of provoking a 429.  A message gives up after
+# DISCORD_MAX_RATE_LIMITS 429s in a row of waiting, and stays queued.
+_DISCORD_RESUME_AT: dict = {}
+DISCORD_MAX_RATE_LIMITS = 5
+
+
+def _discord_retry_after(resp: requests.Response) -> float:
+    """Seconds Discord asks us to wait after a 429."""
     try:
-        requests.post(webhook, json={"content": content}, timeout=15)
-    except requests.RequestException:
+        return max(0.0, float(resp.json()["retry_after"]))
+    except (ValueError, KeyError, TypeError):
         pass
+    wait = _retry_after(resp)
+    if wait is not None:
+        return wait
+    try:
+        return max(0.0, float(resp.headers.get("X-RateLimit-Reset-After", "1")))
+    except ValueError:
+        return 1.0
+
+
+def _deliver_discord(webhook: str, batch: List[Tuple[RBEvent, dict]], name: str = "Discord") -> str:
+    """
+    Post one message of embeds, waiting out rate limits and retrying
+    transient failures.  Returns "sent" on a 2xx, "rejected" if Discord
+    refused the payload itself (400) and "failed" otherwise, with a
+    ``[warn]`` naming destination ``name``.
+    """
+    noun = "event" if len(batch) == 1 else "events"
+    payload = {"content": f"**New Riftbound {noun}!**", "embeds": [embed for _, embed in batch]}
+    attempt = limited = 0
+    while True:
+        pause = _DISCORD_RESUME_AT.get(webhook, 0.0) - time.monotonic()
+        if pause > 0:
+            time.sleep(pause)
+        try:
+            resp = http_session().post(webhook, params={"wait": "true"}, json=payload,
+                                       timeout=(CONNECT_TIMEOUT, READ_TIMEOUT))
+        except (requests.ConnectionError, requests.Timeout) as e:
+            resp, wait, problem = None, _backoff(attempt), str(e)
+            attempt += 1
+        except requests.RequestException as e:
+            # a malformed webhook URL and the like: retrying won't help
+            print(f"[warn] {name}: could not post to Discord: {e}")
+            return "failed"
+        else:
+            if resp.headers.get("X-RateLimit-Remaining") == "0":
+                try:
+                    reset = float(resp.headers.get("X-RateLimit-Reset-After", "0"))
+                except ValueError:
+                    reset = 0.0
+                _DISCORD_RESUME_AT[webhook] = time.monotonic() + min(reset, MAX_RETRY_AFTER)
+            if 200 <= resp.status_code < 300:
+                return "sent"
+            problem = f"HTTP {resp.status_code}"
+            if resp.status_code == 429:
+                # rate limited: wait as asked, without using up a retry
+                wait = _discord_retry_after(resp)
+                limited += 1
+            elif resp.status_code in RETRY_STATUSES:
+                wait = _retry_after(resp) or _backoff(attempt)
+                attempt += 1
+            elif resp.status_code == 400:
+                return "rejected"
+            else:
+                print(f"[warn] {name}: Discord webhook returned {problem}")
+                return "failed"
+        if attempt > RETRY_ATTEMPTS or limited > DISCORD_MAX_RATE_LIMITS or wait > MAX_RETRY_AFTER:
+            print(f"[warn] {name}: giving up on a message of {len(batch)} {noun} ({problem})")
+            return "failed"
+        time.sleep(wait)
+
+
+def post_discord(event: RBEvent) -> bool:
+    """
+    Post a single event to Discord right away using the webhook URL in the
+    ``DISCORD_WEBHOOK_URL`` environment variable.  Returns True if Discord
+    accepted it; if no webhook is set, nothing is posted.
+    """
+    webhook = os.environ.get("DISCORD_WEBHOOK_URL")
+    if not webhook:
+        return False
+    return _deliver_discord(webhook, _discord_batches([event])[0]) == "sent"
+
+
+# ---------------------------------------------------------------------------
+# Notification destinations
+#
+# Events can be posted to several Discord webhooks, each with its own filter.
+# Destinations are read from RIFTBOUND_DESTINATIONS (default destinations.json
+# next to this script), a JSON list such as
+#
+#   [{"name": "all", "webhook_env": "DISCORD_WEBHOOK_URL"},
+#    {"name": "north-west", "webhook_env": "DISCORD_NW_WEBHOOK",
+#     "filter": "borough: Brent | Barnet"},
+#    {"name": "majors", "webhook": "https://discord.com/api/webhooks/...",
+#     "filter": "tier: regional qualifier | worlds; store: Dark Sphere"}]
+#
+# A filter is ``key: value | value`` clauses joined by ``;``: an event must
+# match every clause, and any value within one.  Keys are ``store`` (name
+# without the bracketed area, e.g. "Zombie Games Café"), ``borough`` (see
+# STORE_BOROUGHS) and ``tier`` (a HIGHLIGHT_MAP label without its icon, or
+# "any" for any highlighted event).  No filter matches everything.  Without
+# a destinations file, DISCORD_WEBHOOK_URL (if set) is the only destination.
+# Boroughs can be set or corrected with RIFTBOUND_STORE_BOROUGHS
+# ("store=borough,..."); a store without one never matches a borough filter,
+# and loading such a filter warns about it.
+
+DESTINATIONS_PATH = os.environ.get("RIFTBOUND_DESTINATIONS") or os.path.join(
+    os.path.dirname(__file__), "destinations.json"
+)
+FILTER_KEYS = ("store", "borough", "tier")
+STORE_BOROUGHS = {
+    "dark sphere": "hammersmith and fulham",
+    "the brotherhood games": "southwark",
+    "leisure games": "barnet",
+    "zombie games café": "brent",
+    "europa gaming": "brent",
+    "spellbound games": None,  # not known yet
+}
+STORE_BOROUGHS.update(
+    (store.strip().lower(), borough.strip().lower())
+    for store, _, borough in (
+        item.partition("=") for item in os.environ.get("RIFTBOUND_STORE_BOROUGHS", "").split(",") if "=" in item
+    )
+)
+
+
+@dataclass
+class Destination:
+    name: str
+    webhook: str
+    filter: dict  # key -> set of accepted values; a missing key accepts anything
+
+
+def _store_key(store: str) -> str:
+    return store.split(" (", 1)[0].strip().lower()
+
+
+def _event_keys(event: RBEvent) -> dict:
+    """The values an event offers to each filter key."""
+    store = _store_key(event.store)
+    tag = _op_tag_for(event.title)
+    tier = {tag.split(" ", 1)[-1].lower(), "any"} if tag else set()
+    borough = STORE_BOROUGHS.get(store)
+    return {"store": {store}, "borough": {borough} if borough else set(), "tier": tier}
+
+
+def parse_filter(expr: str) -> dict:
+    """Parse ``key: a | b; key: c`` into {key: {values}}; raises ValueError."""
+    clauses: dict = {}
+    for clause in filter(None, (c.strip() for c in (expr or "").split(";"))):
+        key, sep, values = clause.partition(":")
+        key = key.strip().lower()
+        if not sep or key not in FILTER_KEYS:
+            raise ValueError(f"bad filter clause {clause!r}")
+        wanted = {v.strip().lower() for v in values.split("|") if v.strip()}
+        if key == "store":
+            wanted = {_store_key(v) for v in wanted}
+        clauses.setdefault(key, set()).update(wanted)
+    return clauses
+
+
+def load_destinations(path: str = None) -> List[Destination]:
+    """Read the destinations file, falling back to DISCORD_WEBHOOK_URL."""
+    path = path or DESTINATIONS_PATH
+    if not os.path.exists(path):
+        webhook = os.environ.get("DISCORD_WEBHOOK_URL")
+        return [Destination("default", webhook, {})] if webhook else []
+    with open(path, "r", encoding="utf-8") as f:
+        raw = json.load(f)
+    destinations = []
+    for i, entry in enumerate(raw):
+        name = entry.get("name") or f"destination {i + 1}"
+        if any(d.name == name for d in destinations):
+            # the outbox tracks deliveries by destination name
+            print(f"[warn] Destination {name}: name already used; skipping")
+            continue
+        webhook = entry.get("webhook") or os.environ.get(entry.get("webhook_env", ""))
+        if not webhook:
+            print(f"[warn] Destination {name}: no webhook configured; skipping")
+            continue
+        try:
+            clauses = parse_filter(entry.get("filter", ""))
+        except ValueError as exc:
+            print(f"[warn] Destination {name}: {exc}; skipping")
+            continue
+        destinations.append(Destination(name, webhook, clauses))
+    unmapped = sorted(store for store, borough in STORE_BOROUGHS.items() if not borough)
+    if unmapped and any("borough" in d.filter for d in destinations):
+        print(f"[warn] No borough known for {', '.join(unmapped)}; borough filters never match "
+              f"their events (set RIFTBOUND_STORE_BOROUGHS)")
+    return destinations
+
+
+class DestinationIndex:
+    """
+    Matches events against every destination's filter at once.  For each
+    filter key the index maps a value to the bitmask of destinations that
+    accept it, plus a mask of destinations that don't constrain the key; an
+    event's destinations are the AND over keys of those masks, so matching
+    costs one lookup per key and value however many destinations there are.
+    """
+
+    def __init__(self, destinations: List[Destination]) -> None:
+        self.destinations = destinations
+        self.by_value = {key: {} for key in FILTER_KEYS}
+        self.unconstrained = dict.fromkeys(FILTER_KEYS, 0)
+        for bit, dest in enumerate(destinations):
+            for key in FILTER_KEYS:
+                if key not in dest.filter:
+                    self.unconstrained[key] |= 1 << bit
+                    continue
+                index = self.by_value[key]
+                for value in dest.filter[key]:
+                    index[value] = index.get(value, 0) | 1 << bit
+
+    def match(self, event: RBEvent) -> List[Destination]:
+        mask = (1 << len(self.destinations)) - 1
+        for key, values in _event_keys(event).items():
+            accepted = self.unconstrained[key]
+            index = self.by_value[key]
+            for value in values:
+                accepted |= index.get(value, 0)
+            mask &= accepted
+            if not mask:
+                return []
+        return [dest for bit, dest in enumerate(self.destinations) if mask >> bit & 1]
+
+
+# ---------------------------------------------------------------------------
+# Discord outbox
+#
+# New events are queued in OUTBOX_PATH, each with the destinations it still
+# has to reach, and the queue is saved before anything is posted and again
+# after every message Discord accepts.  An event leaves the queue (and
+# enters the seen state) once every one of its destinations has answered 2xx;
+# destinations are posted to concurrently, each webhook's messages in order.
+# Whatever is still queued when a run gives up — rate limited for too long,
+# webhook down — is posted first by the next run, unless the event started
+# before yesterday, in which case it is dropped.  If Discord refuses a
+# message (400), its events are resent one per message and only an event
+# that is refused on its own is dropped for that destination.  Events that
+# match no destination (or when none are configured) count as delivered
+# straight away.
+
+OUTBOX_PATH = os.path.join(DATA_DIR, "outbox.json")
+
+
+class DiscordOutbox:
+    """Persistent queue of events waiting to be posted to Discord."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.pending: Optional[dict] = None
+        self.stats = {"delivered": 0, "messages": 0, "rejected": 0, "expired": 0}
+        self.refused: Set[str] = set()
+        self.lock = threading.Lock()
+
+    def _load(self) -> dict:
+        if self.pending is None:
+            self.pending = _read_json(self.path, {})
+            for uid, entry in self.pending.items():
+                if "event" not in entry:
+                    # queued before destinations existed: route it again
+                    self.pending[uid] = {"event": entry, "destinations": None}
+        return self.pending
+
+    def __contains__(self, event: RBEvent) -> bool:
+        return event.uid() in self._load()
+
+    def enqueue(self, events: List[RBEvent], index: DestinationIndex) -> None:
+        pending = self._load()
+        for ev in events:
+            pending[ev.uid()] = {"event": ev.to_dict(), "destinations": [d.name for d in index.match(ev)]}
+
+    def _drain_destination(self, dest: Destination, events: List[RBEvent]) -> None:
+        batches = deque(_discord_batches(events))
+        while batches:
+            batch = batches.popleft()
+            outcome = _deliver_discord(dest.webhook, batch, dest.name)
+            if outcome == "failed":
+                return
+            if outcome == "rejected" and len(batch) > 1:
+                # one bad embed spoils the whole message: find it by sending each event alone
+                batches.extendleft([item] for item in reversed(batch))
+                continue
+            with self.lock:
+                if outcome == "rejected":
+                    ev = batch[0][0]
+                    print(f"[warn] {dest.name}: Discord rejected {ev.title!r} ({ev.url}); dropping it")
+                    self.stats["rejected"] += 1
+                    self.refused.add(ev.uid())
+                else:
+                    self.stats["messages"] += 1
+                for ev, _ in batch:
+                    self.pending[ev.uid()]["destinations"].remove(dest.name)
+                self.save()
+
+    def drain(self, index: DestinationIndex, now: datetime) -> List[RBEvent]:
+        """
+        Post everything queued, oldest event first; return the events that
+        are done with (posted everywhere, or refused by Discord for some
+        destinations).  Events that started before yesterday are dropped.
+        """
+        pending = self._load()
+        by_name = {d.name: d for d in index.destinations}
+        queues: dict = {name: [] for name in by_name}
+        events = {}
+        for uid, entry in list(pending.items()):
+            ev = RBEvent.from_dict(entry["event"])
+            if ev.start < now - timedelta(days=1):
+                print(f"[warn] Outbox: {ev.title!r} on {ev.start:%Y-%m-%d} was never posted to "
+                      f"{', '.join(entry['destinations'] or ['its destinations'])}; dropping it")
+                self.stats["expired"] += 1
+                del pending[uid]
+                continue
+            events[uid] = ev
+            if entry["destinations"] is None:
+                entry["destinations"] = [d.name for d in index.match(ev)]
+            # destinations removed from the config since the event was queued are dropped
+            entry["destinations"] = [name for name in entry["destinations"] if name in by_name]
+            for name in entry["destinations"]:
+                queues[name].append(ev)
+        work = [(by_name[name], sorted(evs, key=lambda e: e.start)) for name, evs in queues.items() if evs]
+        if work:
+            with ThreadPoolExecutor(max_workers=len(work)) as pool:
+                list(pool.map(lambda job: self._drain_destination(*job), work))
+        done = sorted(
+            (events[uid] for uid, entry in pending.items() if not entry["destinations"]),
+            key=lambda e: e.start,
+        )
+        for ev in done:
+            del pending[ev.uid()]
+        self.stats["delivered"] += sum(ev.uid() not in self.refused for ev in done)
+        return done
+
+    def save(self) -> None:
+        if self.pending is not None:
+            _write_json(self.path, self.pending)
+
+    def report(self) -> None:
+        pending = len(self.pending or {})
+        line = f"[outbox] {self.stats['delivered']} delivered in {self.stats['messages']} messages, {pending} pending"
+        if self.stats["rejected"]:
+            line += f", {self.stats['rejected']} rejected"
+        if self.stats["expired"]:
+            line += f", {self.stats['expired']} expired"
+        print(line)
+
+
+OUTBOX = DiscordOutbox(OUTBOX_PATH)
+
+
+# ---------------------------------------------------------------------------
+# Retries and run budget
+#
+# Failed requests are retried with "full jitter" exponential backoff.
+# Connect and read timeouts are separate so a dead host fails fast.  A run
+# can be given a wall‑clock budget (RIFTBOUND_BUDGET seconds or --budget).
+# Once less than DETAIL_RESERVE of it is left, product‑detail fetches are
+# refused so the remaining time goes to hub pages.  Past the deadline
+# nothing more is sent.
+
+PRIORITY_HUB = 0
+PRIORITY_DETAIL = 1
+CONNECT_TIMEOUT = float(os.environ.get("RIFTBOUND_CONNECT_TIMEOUT", "5"))
+READ_TIMEOUT = float(os.environ.get("RIFTBOUND_READ_TIMEOUT", "20"))
+RETRY_ATTEMPTS = int(os.environ.get("RIFTBOUND_RETRIES", "2"))
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 8.0
+MAX_RETRY_AFTER = 120.0
+DETAIL_RESERVE = 0.25
+_BUDGET: Optional[float] = None
+_DEADLINE: Optional[float] = None
+
+
+class BudgetExceeded(OSError):
+    """
+    Raised instead of sending a request once the run budget is spent.  Like
+    requests' own errors it is an OSError; code that tolerates a failed
+    fetch catches both.
+    """
+
+
+def set_run_budget(seconds: Optional[float]) -> None:
+    """Start the run's wall‑clock budget now (None for no limit)."""
+    global _BUDGET, _DEADLINE
+    _BUDGET = seconds
+    _DEADLINE = time.monotonic() + seconds if seconds else None
+
+
+def _cutoff(priority: int) -> Optional[float]:
+    """The monotonic time after which requests of ``priority`` are refused."""
+    if _DEADLINE is None:
+        return None
+    if priority == PRIORITY_DETAIL:
+        return _DEADLINE - DETAIL_RESERVE * _BUDGET
+    return _DEADLINE
+
+
+def _check_budget(priority: int, wait: float = 0.0) -> None:
+    """Raise BudgetExceeded if a request sent after ``wait`` seconds would be too late."""
+    cutoff = _cutoff(priority)
+    if cutoff is not None and time.monotonic() + wait >= cutoff:
+        kind = "detail" if priority == PRIORITY_DETAIL else "hub"
+        raise BudgetExceeded(f"run budget exhausted for {kind} pages")
+
+
+def _timeouts(priority: int) -> Tuple[float, float]:
+    """(connect, read) timeouts, trimmed so a request can't outlast the budget."""
+    cutoff = _cutoff(priority)
+    if cutoff is None:
+        return CONNECT_TIMEOUT, READ_TIMEOUT
+    left = max(0.1, cutoff - time.monotonic())
+    return min(CONNECT_TIMEOUT, left), min(READ_TIMEOUT, left)
+
+
+def _backoff(attempt: int) -> float:
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+
+
+DEFAULT_BUDGET = float(os.environ["RIFTBOUND_BUDGET"]) if os.environ.get("RIFTBOUND_BUDGET") else None
 
 
 # ---------------------------------------------------------------------------
 # Fetch helpers
 
-def fetch(url: str) -> BeautifulSoup:
+# Fetch engine.  "sync" downloads pages one after another; "async" fans a
+# batch of pages out on an asyncio loop.  requests is blocking, so under the
+# async engine downloads run on the loop's executor and parsing on a separate
+# thread pool, keeping the loop free to service other sockets.  Either way no
+# more than MAX_INFLIGHT requests are on the wire at once across all threads.
+FETCH_ENGINES = ("sync", "async")
+FETCH_ENGINE = os.environ.get("RIFTBOUND_FETCH_ENGINE", "sync")
+MAX_INFLIGHT = int(os.environ.get("RIFTBOUND_MAX_INFLIGHT", "8"))
+_INFLIGHT = threading.BoundedSemaphore(MAX_INFLIGHT)
+_PARSE_POOL: Optional[ThreadPoolExecutor] = None
+_PARSE_POOL_LOCK = threading.Lock()
+
+# BeautifulSoup tree builder used for every page.  "lxml" is several times
+# faster than the pure‑Python "html.parser" but needs the lxml package; if
+# the chosen builder isn't installed we fall back to "html.parser".
+PARSER_BACKENDS = ("html.parser", "lxml", "html5lib")
+PARSER = os.environ.get("RIFTBOUND_PARSER", "html.parser")
+
+
+def configure_fetch(engine: Optional[str] = None, max_inflight: Optional[int] = None,
+                    parser: Optional[str] = None) -> None:
+    """Select the fetch engine, the global in‑flight request limit and/or the HTML parser."""
+    global FETCH_ENGINE, MAX_INFLIGHT, _INFLIGHT, PARSER
+    if engine is not None:
+        if engine not in FETCH_ENGINES:
+            raise ValueError(f"unknown fetch engine {engine!r}")
+        FETCH_ENGINE = engine
+    if max_inflight is not None:
+        MAX_INFLIGHT = max(1, max_inflight)
+        _INFLIGHT = threading.BoundedSemaphore(MAX_INFLIGHT)
+    if parser is not None:
+        if parser not in PARSER_BACKENDS:
+            raise ValueError(f"unknown parser backend {parser!r}")
+        PARSER = parser
+    if bs4.builder_registry.lookup(PARSER) is None:
+        print(f"[warn] parser backend {PARSER} is not installed; using html.parser")
+        PARSER = "html.parser"
+
+
+def _parse_pool() -> ThreadPoolExecutor:
+    global _PARSE_POOL
+    with _PARSE_POOL_LOCK:
+        if _PARSE_POOL is None:
+            _PARSE_POOL = ThreadPoolExecutor(thread_name_prefix="riftbound-parse")
+        return _PARSE_POOL
+
+
+def _request(url: str, headers: Optional[dict] = None, priority: int = PRIORITY_HUB) -> requests.Response:
+    """
+    GET a URL through the shared session.  The request first waits for its
+    host's politeness budget (see ``HostScheduler``) and only then takes one
+    of the global in‑flight slots.  Connection errors, timeouts and
+    429/5xx answers are retried with jittered exponential backoff (or after
+    the server's Retry‑After), and nothing is sent once the run budget for
+    ``priority`` is spent.
+    """
+    host = urlsplit(url).netloc
+    attempt = 0
+    while True:
+        with HOSTS.slot(host):
+            _check_budget(priority)
+            with _INFLIGHT:
+                started = time.monotonic()
+                resp: Optional[requests.Response] = None
+                try:
+                    resp = http_session().get(url, headers=headers, timeout=_timeouts(priority))
+                except (requests.ConnectionError, requests.Timeout):
+                    if attempt >= RETRY_ATTEMPTS:
+                        raise
+                finally:
+                    HOSTS.record_wire(host, time.monotonic() - started)
+        if resp is not None and (resp.status_code not in RETRY_STATUSES or attempt >= RETRY_ATTEMPTS):
+            return resp
+        delay = _retry_after(resp) if resp is not None else None
+        if delay is None:
+            delay = _backoff(attempt)
+            _check_budget(priority, delay)
+            time.sleep(delay)
+        elif delay <= MAX_RETRY_AFTER:
+            _check_budget(priority, delay)
+            HOSTS.back_off(host, delay)
+        else:
+            return resp
+        attempt += 1
+
+
+def _download(url: str) -> str:
+    """GET a page and return its text."""
+    resp = _request(url)
+    resp.raise_for_status()
+    return resp.text
+
+
+def _parse(text: str) -> bs4.BeautifulSoup:
+    return bs4.BeautifulSoup(text, PARSER)
+
+
+# Hub pages are only mined for their links, so there we build a tree of just
+# the <a href> elements (and their contents) and let the parser discard the
+# rest of the markup as it streams past.  html5lib can't do partial parses.
+@lru_cache(maxsize=None)
+def _links_only() -> bs4.SoupStrainer:
+    return bs4.SoupStrainer("a", href=True)
+
+
+def _parse_links(text: str) -> bs4.BeautifulSoup:
+    """Parse only the ``<a href>`` elements of a page."""
+    if PARSER == "html5lib":
+        return _parse(text)
+    return bs4.BeautifulSoup(text, PARSER, parse_only=_links_only())
+
+
+def fetch(url: str) -> bs4.BeautifulSoup:
     """
     Download the given URL and return a BeautifulSoup object.  A custom
     user‑agent is supplied to improve our chances with basic anti‑bot
     filters.
     """
-    resp = requests.get(url, headers=HEADERS, timeout=30)
+    return _parse(_download(url))
+
+
+def _finish_page(url: str, resp: requests.Response, extract: Callable[[Any, str], Any], variant: str,
+                 parse: Callable[[str], Any] = _parse, priority: int = PRIORITY_HUB) -> Any:
+    """Turn a (possibly conditional) response into ``extract``'s result."""
+    if resp.status_code == 304:
+        hit, result = PAGE_CACHE.reuse(url, variant)
+        if hit:
+            return result
+        resp = _request(url, priority=priority)
     resp.raise_for_status()
-    return BeautifulSoup(resp.text, "html.parser")
+    digest = hashlib.sha1(resp.content).hexdigest()
+    hit, result = PAGE_CACHE.reuse(url, variant, digest)
+    if hit:
+        return result
+    result = extract(parse(resp.text), url)
+    PAGE_CACHE.store(url, variant, resp, digest, result)
+    return result
+
+
+def fetch_page(url: str, extract: Callable[[Any, str], Any], variant: str = "",
+               parse: Callable[[str], Any] = _parse, priority: int = PRIORITY_HUB) -> Any:
+    """
+    Fetch a page and return ``extract(soup, url)``.  The request carries the
+    validators from the last visit, and if the server answers 304 -- or
+    sends back a body identical to last time -- the result extracted last
+    time is returned without parsing anything.
+    ``variant`` should capture anything besides the page that the result
+    depends on (e.g. the default year); a different variant forces a full
+    fetch.  ``parse`` turns the body into what ``extract`` expects (by
+    default a BeautifulSoup tree; pass ``json.loads`` for JSON endpoints).
+    ``priority`` is PRIORITY_HUB or PRIORITY_DETAIL (see ``set_run_budget``).
+    """
+    resp = _request(url, PAGE_CACHE.validators(url, variant), priority)
+    return _finish_page(url, resp, extract, variant, parse, priority)
+
+
+def fetch_many(urls: List[str], extract: Callable[[Any, str], Any], variant: str = "",
+               parse: Callable[[str], Any] = _parse, priority: int = PRIORITY_HUB) -> List[Any]:
+    """
+    Like ``fetch_page`` for several URLs, returning one result per URL in
+    order, or None for pages that could not be downloaded (counted by
+    ``_note_missed``).  Errors raised by ``extract`` propagate to the caller.
+    """
+    if FETCH_ENGINE == "async" and len(urls) > 1:
+        results = asyncio.run(_fetch_many_async(urls, extract, variant, parse, priority))
+    else:
+        results = []
+        for url in urls:
+            try:
+                results.append(fetch_page(url, extract, variant, parse, priority))
+            except (requests.RequestException, BudgetExceeded):
+                results.append(None)
+    _note_missed(sum(result is None for result in results))
+    return results
+
+
+# Pages a scrape had to do without, counted per thread: each source is
+# scraped on one thread, and a source that missed pages may not have seen
+# every event its site lists.
+_MISSED = threading.local()
+
+
+def _note_missed(pages: int = 1) -> None:
+    _MISSED.pages = getattr(_MISSED, "pages", 0) + pages
+
+
+async def _fetch_many_async(urls: List[str], extract: Callable[[Any, str], Any], variant: str,
+                            parse: Callable[[str], Any], priority: int) -> List[Any]:
+    loop = asyncio.get_running_loop()
+
+    async def one(url: str) -> Any:
+        try:
+            resp = await loop.run_in_executor(None, _request, url, PAGE_CACHE.validators(url, variant), priority)
+            return await loop.run_in_executor(
+                _parse_pool(), _finish_page, url, resp, extract, variant, parse, priority)
+        except (requests.RequestException, BudgetExceeded):
+            return None
+
+    return await asyncio.gather(*(one(url) for url in urls))
+
+
+# ---------------------------------------------------------------------------
+# Per‑host politeness
+#
+# Each host gets a concurrency cap and a requests‑per‑second budget so that
+# bursts of product‑page fetches don't get us rate limited or blocked.  The
+# limits are (max concurrent requests, requests per second) per host; extra
+# or different ones can be given as RIFTBOUND_HOST_LIMITS, e.g.
+# "www.europagaming.co.uk=1:0.5,leisuregames.com=4:2".
+
+DEFAULT_HOST_LIMIT = (4, 4.0)
+HOST_LIMITS = {
+    "www.zombiegamescafe.com": (2, 1.0),
+    "www.europagaming.co.uk": (2, 1.0),
+}
+
+
+def _parse_host_limits(spec: str) -> dict:
+    limits = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        host, _, value = item.partition("=")
+        concurrency, _, rate = value.partition(":")
+        limits[host.strip()] = (max(1, int(concurrency)), float(rate or DEFAULT_HOST_LIMIT[1]))
+    return limits
+
+
+HOST_LIMITS.update(_parse_host_limits(os.environ.get("RIFTBOUND_HOST_LIMITS", "")))
+
+
+def _retry_after(resp: requests.Response) -> Optional[float]:
+    """Seconds to wait according to a Retry‑After header (delta or HTTP date)."""
+    value = resp.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class HostScheduler:
+    """
+    Per‑host concurrency limits and request spacing.  ``slot(host)`` blocks
+    until the host has a free connection slot and its next request is due,
+    and accounts the time spent waiting; ``record_wire`` accounts the time
+    spent on the request itself.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.semaphores: dict = {}
+        self.next_due: dict = {}
+        self.stats: dict = {}
+
+    def _limits(self, host: str) -> Tuple[int, float]:
+        return HOST_LIMITS.get(host, DEFAULT_HOST_LIMIT)
+
+    def _host_stats(self, host: str) -> dict:
+        return self.stats.setdefault(host, {"requests": 0, "queued": 0.0, "wire": 0.0})
+
+    @contextmanager
+    def slot(self, host: str):
+        queued_at = time.monotonic()
+        with self.lock:
+            sem = self.semaphores.get(host)
+            if sem is None:
+                sem = self.semaphores[host] = threading.BoundedSemaphore(self._limits(host)[0])
+        with sem:
+            with self.lock:
+                now = time.monotonic()
+                due = max(now, self.next_due.get(host, now))
+                self.next_due[host] = due + 1.0 / self._limits(host)[1]
+            if due > now:
+                time.sleep(due - now)
+            with self.lock:
+                counts = self._host_stats(host)
+                counts["requests"] += 1
+                counts["queued"] += time.monotonic() - queued_at
+            yield
+
+    def back_off(self, host: str, delay: float) -> None:
+        """Hold all requests to ``host`` for ``delay`` seconds (Retry‑After)."""
+        with self.lock:
+            until = time.monotonic() + delay
+            self.next_due[host] = max(self.next_due.get(host, until), until)
+
+    def record_wire(self, host: str, seconds: float) -> None:
+        with self.lock:
+            self._host_stats(host)["wire"] += seconds
+
+    def report(self) -> None:
+        for host, counts in sorted(self.stats.items()):
+            print(
+                f"[hosts] {host}: {counts['requests']} requests, "
+                f"{counts['queued']:.1f}s queued, {counts['wire']:.1f}s on the wire"
+            )
+
+
+HOSTS = HostScheduler()
+
+
+# ---------------------------------------------------------------------------
+# Page cache
+#
+# Remembers, per URL, the HTTP validators (ETag / Last‑Modified) and a SHA‑1
+# of the body of the last response, together with the result extracted from
+# it.  An unchanged page then costs a 304 (or, for sites without validators,
+# a download and a hash) but no parsing.  Results are stored as JSON;
+# RBEvents, ProductDetails and dates are tagged so they round‑trip.
+
+PAGE_CACHE_PATH = os.path.join(DATA_DIR, "page_cache.json")
+PAGE_CACHE_MAX_AGE = timedelta(days=14)
+# Bump when an extractor's result changes shape so old entries are ignored.
+PAGE_CACHE_VERSION = 1
+
+
+def _to_json(obj: Any) -> Any:
+    if isinstance(obj, RBEvent):
+        return {"__event__": obj.to_dict()}
+    if isinstance(obj, ProductDetail):
+        return {"__product__": {k: _to_json(v) for k, v in asdict(obj).items()}}
+    if isinstance(obj, datetime):
+        return {"__datetime__": obj.isoformat()}
+    if isinstance(obj, date):
+        return {"__date__": obj.isoformat()}
+    if isinstance(obj, (list, tuple)):
+        return [_to_json(x) for x in obj]
+    return obj
+
+
+def _from_json(obj: Any) -> Any:
+    if isinstance(obj, list):
+        return [_from_json(x) for x in obj]
+    if isinstance(obj, dict):
+        if "__event__" in obj:
+            return RBEvent.from_dict(obj["__event__"])
+        if "__product__" in obj:
+            return ProductDetail(**{k: _from_json(v) for k, v in obj["__product__"].items()})
+        if "__datetime__" in obj:
+            return datetime.fromisoformat(obj["__datetime__"])
+        if "__date__" in obj:
+            return date.fromisoformat(obj["__date__"])
+    return obj
+
+
+def _read_json(path: str, default: dict) -> dict:
+    """Read a JSON object from ``path``; ``default`` if it is missing, unreadable or not an object."""
+    if not os.path.exists(path):
+        return default
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            raw = json.load(f)
+    except (OSError, ValueError):
+        return default
+    return raw if isinstance(raw, dict) else default
+
+
+def _write_json(path: str, obj: Any) -> None:
+    """Write JSON to ``path`` atomically so readers never see half a file."""
+    _atomic_write(path, json.dumps(obj, indent=2, sort_keys=True))
+
+
+class PageCache:
+    """Persistent per‑URL validator/digest/result cache with per‑host counters."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.entries: Optional[dict] = None
+        self.stats: dict = {}
+        self.lock = threading.Lock()
+
+    def _load(self) -> dict:
+        if self.entries is None:
+            self.entries = _read_json(self.path, {})
+        return self.entries
+
+    def _count(self, url: str, outcome: str) -> None:
+        host = urlsplit(url).netloc
+        counts = self.stats.setdefault(host, {"not_modified": 0, "unchanged": 0, "parsed": 0})
+        counts[outcome] += 1
+
+    def validators(self, url: str, variant: str) -> dict:
+        """Return conditional request headers for ``url``, if we have any."""
+        with self.lock:
+            entry = self._load().get(url)
+        if not entry or entry.get("variant") != variant or entry.get("version") != PAGE_CACHE_VERSION:
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def reuse(self, url: str, variant: str, digest: Optional[str] = None) -> Tuple[bool, Any]:
+        """
+        Return (True, result) for a cached entry, either after a 304 (no
+        ``digest``) or when ``digest`` matches the body we parsed last time.
+        """
+        with self.lock:
+            entry = self._load().get(url)
+            if not entry or entry.get("variant") != variant or entry.get("version") != PAGE_CACHE_VERSION:
+                return False, None
+            if digest is not None and entry.get("digest") != digest:
+                return False, None
+            entry["used"] = datetime.now(timezone.utc).isoformat()
+            self._count(url, "unchanged" if digest else "not_modified")
+        return True, _from_json(entry["result"])
+
+    def store(self, url: str, variant: str, resp: requests.Response, digest: str, result: Any) -> None:
+        with self.lock:
+            self._count(url, "parsed")
+            self._load()[url] = {
+                "variant": variant,
+                "version": PAGE_CACHE_VERSION,
+                "etag": resp.headers.get("ETag"),
+                "last_modified": resp.headers.get("Last-Modified"),
+                "digest": digest,
+                "result": _to_json(result),
+                "used": datetime.now(timezone.utc).isoformat(),
+            }
+
+    def save(self) -> None:
+        """Persist the cache, dropping entries unused for PAGE_CACHE_MAX_AGE."""
+        with self.lock:
+            if self.entries is None:
+                return
+            cutoff = (datetime.now(timezone.utc) - PAGE_CACHE_MAX_AGE).isoformat()
+            self.entries = {u: e for u, e in self.entries.items() if e.get("used", "") >= cutoff}
+            _write_json(self.path, self.entries)
+
+    def report(self) -> None:
+        for host, counts in sorted(self.stats.items()):
+            print(
+                f"[cache] {host}: {counts['not_modified']} not modified, "
+                f"{counts['unchanged']} unchanged, {counts['parsed']} parsed"
+            )
+
+
+PAGE_CACHE = PageCache(PAGE_CACHE_PATH)
+
+
+# ---------------------------------------------------------------------------
+# Product detail cache
+#
+# Product and event‑detail pages rarely change once they carry a date, so
+# what we extracted from each one is remembered by URL and the page is not
+# fetched again until the entry is PRODUCT_CACHE_TTL old or its event date
+# has passed (Wix stores reuse product pages for recurring events).
+
+PRODUCT_CACHE_PATH = os.path.join(DATA_DIR, "product_cache.json")
+PRODUCT_CACHE_TTL = timedelta(days=float(os.environ.get("RIFTBOUND_PRODUCT_TTL_DAYS", "7")))
+
+
+@dataclass
+class ProductDetail:
+    """What a product/event page told us.  ``date`` is None if it had none."""
+
+    title: str
+    date: Optional[date]
+    start: Optional[str] = None
+    end: Optional[str] = None
+
+
+class ProductCache:
+    """Persistent per‑URL store of ``ProductDetail`` with TTL and date expiry."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.entries: Optional[dict] = None
+        self.stats = {"cached": 0, "fetched": 0}
+        self.lock = threading.Lock()
+
+    def _load(self) -> dict:
+        if self.entries is None:
+            self.entries = _read_json(self.path, {})
+        return self.entries
+
+    @staticmethod
+    def _fresh(entry: dict, now: datetime) -> bool:
+        fetched = datetime.fromisoformat(entry["fetched"])
+        if now - fetched > PRODUCT_CACHE_TTL:
+            return False
+        return not entry.get("date") or date.fromisoformat(entry["date"]) >= now.date()
+
+    def get(self, url: str, now: datetime) -> Optional[ProductDetail]:
+        """Return the cached detail for ``url`` if it is still fresh."""
+        with self.lock:
+            entry = self._load().get(url)
+            if not entry or not self._fresh(entry, now):
+                return None
+            self.stats["cached"] += 1
+        return ProductDetail(
+            title=entry["title"],
+            date=date.fromisoformat(entry["date"]) if entry.get("date") else None,
+            start=entry.get("start"),
+            end=entry.get("end"),
+        )
+
+    def put(self, url: str, detail: ProductDetail, now: datetime) -> None:
+        with self.lock:
+            self.stats["fetched"] += 1
+            self._load()[url] = {
+                "fetched": now.isoformat(),
+                "title": detail.title,
+                "date": detail.date.isoformat() if detail.date else None,
+                "start": detail.start,
+                "end": detail.end,
+            }
+
+    def save(self) -> None:
+        """Persist the cache, dropping entries that are stale or in the past."""
+        with self.lock:
+            if self.entries is None:
+                return
+            now = datetime.now(tz=LONDON_TZ)
+            self.entries = {u: e for u, e in self.entries.items() if self._fresh(e, now)}
+            _write_json(self.path, self.entries)
+
+    def report(self) -> None:
+        print(f"[products] {self.stats['cached']} from cache, {self.stats['fetched']} fetched")
+
+
+PRODUCT_CACHE = ProductCache(PRODUCT_CACHE_PATH)
+
+
+def fetch_product_details(urls: List[str], extract: Callable[[bs4.BeautifulSoup, str], ProductDetail],
+                          now: datetime) -> List[Optional[ProductDetail]]:
+    """
+    Return a ``ProductDetail`` per URL (None if the page could not be
+    downloaded), fetching only pages with no fresh entry in PRODUCT_CACHE.
+    """
+    details = {url: PRODUCT_CACHE.get(url, now) for url in urls}
+    missing = [url for url, detail in details.items() if detail is None]
+    for url, detail in zip(missing, fetch_many(missing, extract, variant=str(now.year), priority=PRIORITY_DETAIL)):
+        if detail is not None:
+            PRODUCT_CACHE.put(url, detail, now)
+        details[url] = detail
+    return [details[url] for url in urls]
+
+
+# ---------------------------------------------------------------------------
+# Text extraction
+#
+# Dates and times are pulled out of titles and page bodies with one compiled
+# pattern.  It is tried wherever one or two digits are followed by ":", "/"
+# or "-", and records every time range, single time and numeric date that
+# starts there.  One pass therefore finds all
+# candidates of every kind, in order of appearance (overlapping ones too,
+# e.g. the start of a range is also a single time).
+
+_TIME_RANGE_PAT = r"(?P<range_start>\d{1,2}:\d{2})\s*[–-]\s*(?P<range_end>\d{1,2}:\d{2})"   # “19:00 - 23:00”
+_TIME_PAT = r"(?P<time>\d{1,2}:\d{2}\s*(?:am|pm)?)"                                      # “6:30pm”
+_DATE_PAT = r"(?P<day>\d{1,2})[/\-](?P<month>\d{1,2})(?:[/\-](?P<year>\d{2,4}))?"           # “13/12/2025”
+_CANDIDATE_RE = re.compile(
+    rf"(?=\d{{1,2}}[:/\-])(?:(?={_TIME_RANGE_PAT}))?(?:(?={_TIME_PAT}))?(?:(?={_DATE_PAT}))?",
+    re.I,
+)
+
+
+@dataclass
+class TextCandidates:
+    """Date/time candidates found in a text, each list in order of appearance."""
+
+    ranges: List[Tuple[int, str, str]]                 # (offset, start, end)
+    times: List[Tuple[int, str]]                       # (offset, time)
+    dates: List[Tuple[int, int, int, Optional[str]]]   # (offset, day, month, year as written)
+
+    def time_range(self) -> Tuple[Optional[str], Optional[str]]:
+        """The first time range, else the first single time with no end."""
+        if self.ranges:
+            return self.ranges[0][1], self.ranges[0][2]
+        if self.times:
+            return self.times[0][1], None
+        return None, None
+
+    def first_time(self) -> Optional[str]:
+        return self.times[0][1] if self.times else None
+
+    def first_date(self, default_year: int) -> Optional[date]:
+        """The first numeric date (None if it isn't a real date)."""
+        if not self.dates:
+            return None
+        _, d, mth, y = self.dates[0]
+        year = (2000 + int(y)) if y and len(y) == 2 else (int(y) if y else default_year)
+        try:
+            return date(year, mth, d)
+        except ValueError:
+            return None
+
+
+def scan_text(text: str) -> TextCandidates:
+    """Collect every date, time range and single time in ``text`` in one scan."""
+    found = TextCandidates(ranges=[], times=[], dates=[])
+    for m in _CANDIDATE_RE.finditer(text):
+        pos = m.start()
+        if m.group("range_start"):
+            found.ranges.append((pos, m.group("range_start"), m.group("range_end")))
+        if m.group("time"):
+            found.times.append((pos, m.group("time")))
+        if m.group("day"):
+            found.dates.append((pos, int(m.group("day")), int(m.group("month")), m.group("year")))
+    return found
 
 
 def parse_time_range(text: str) -> Tuple[Optional[str], Optional[str]]:
@@ -237,14 +1766,7 @@ def parse_time_range(text: str) -> Tuple[Optional[str], Optional[str]]:
     Extract a start and end time from text, returning (start, end).  If only
     a single time is found, the end may be None.
     """
-    # e.g. “19:00 - 23:00” or “6:30pm – 10pm”
-    m = re.search(r"(\d{1,2}:\d{2})\s*[–-]\s*(\d{1,2}:\d{2})", text)
-    if m:
-        return m.group(1), m.group(2)
-    m2 = re.search(r"(\d{1,2}:\d{2}\s*(?:am|pm)?)", text, re.I)
-    if m2:
-        return m2.group(1), None
-    return None, None
+    return scan_text(text).time_range()
 
 
 # ---------------------------------------------------------------------------
@@ -252,92 +1774,155 @@ def parse_time_range(text: str) -> Tuple[Optional[str], Optional[str]]:
 
 # ---- Dark Sphere (calendar)
 DARKSPHERE_URL = "https://www.darksphere.co.uk/gamingcalendar.php"
+DARKSPHERE_STORE = "Dark Sphere (Shepherd's Bush)"
 
 def scrape_darksphere(now: datetime) -> List[RBEvent]:
-    soup = fetch(DARKSPHERE_URL)
+    return fetch_page(DARKSPHERE_URL, lambda soup, _url: _darksphere_events(soup, now), variant=now.strftime("%Y-%m"))
+
+
+# Dark Sphere marks days with headings like “9. Sunday”.  Headers longer
+# than _DAY_HEADER_MAX characters are not considered (“31. Wednesday” is 13).
+_DAY_HEADER_RE = re.compile(r"^(\d{1,2})\.\s*[A-Za-z]+$")
+_DAY_HEADER_TAGS = {"div", "p", "span", "h1", "h2", "h3", "h4"}
+_DAY_HEADER_MAX = 64
+_DAY_HEADER_LOOKBEHIND = 10
+_MONTH_RE = re.compile(r"^(January|February|March|April|May|June|July|August|September|October|November|December)$", re.I)
+
+
+def _short_texts(tags: List[bs4.Tag]) -> dict:
+    """
+    Map ``id(tag)`` to ``tag.get_text(strip=True)`` for every tag whose text
+    is at most _DAY_HEADER_MAX characters long (None for longer ones).
+    ``tags`` must be in document order; working backwards each tag is built
+    from its children's entries, so the whole map costs one linear pass
+    rather than a get_text() per tag.
+    """
+    short: dict = {}
+    tag_type, text_types = bs4.Tag, (bs4.NavigableString, bs4.CData)
+    for tag in reversed(tags):
+        parts: List[str] = []
+        total = 0
+        for child in tag.children:
+            if isinstance(child, tag_type):
+                piece = short[id(child)]
+                if piece is None:
+                    parts = None
+                    break
+            elif type(child) in text_types:
+                piece = child.strip()
+            else:
+                continue
+            total += len(piece)
+            if total > _DAY_HEADER_MAX:
+                parts = None
+                break
+            parts.append(piece)
+        short[id(tag)] = "".join(parts) if parts is not None else None
+    return short
+
+
+def _darksphere_events(soup: bs4.BeautifulSoup, now: datetime) -> List[RBEvent]:
     events: List[RBEvent] = []
     # Determine the month being shown (e.g., “November”).  If not present,
     # default to the current month.
-    month_el = soup.find(string=re.compile(r"^(January|February|March|April|May|June|July|August|September|October|November|December)$", re.I))
+    month_el = soup.find(string=_MONTH_RE)
     month_name = month_el.strip() if month_el else now.strftime("%B")
     year = now.year
     current_day: Optional[int] = None
-    for node in soup.find_all(True):
-        # Dark Sphere marks days with headings like “9. Sunday”
-        if node.name in {"div", "p", "span", "h1", "h2", "h3", "h4"} and node.get_text(strip=True):
-            mday = re.match(r"^(\d{1,2})\.\s*[A-Za-z]+$", node.get_text(strip=True))
+    tags = soup.find_all(True)
+    short = _short_texts(tags)
+    # The last few tags before the current one, for links that precede the
+    # first day header we recognise.
+    recent: deque = deque(maxlen=_DAY_HEADER_LOOKBEHIND)
+    for node in tags:
+        if node.name in _DAY_HEADER_TAGS and short[id(node)]:
+            mday = _DAY_HEADER_RE.match(short[id(node)])
             if mday:
                 current_day = int(mday.group(1))
+                recent.append(node)
                 continue
         # Event links live in <a> elements with text containing “Riftbound”
-        if node.name == "a" and node.get_text(strip=True):
-            title = node.get_text(" ", strip=True)
-            if "riftbound" not in title.lower():
-                continue
-            # Look in nearby siblings for time information
-            time_text = ""
-            for sib in list(node.next_siblings)[:3]:
-                if hasattr(sib, "get_text"):
-                    time_text += " " + sib.get_text(" ", strip=True)
-                elif isinstance(sib, str):
-                    time_text += " " + sib.strip()
-            start_str, end_str = parse_time_range(time_text)
-            if current_day is None:
-                # Walk backwards up to 10 elements to find a day header
-                prev = node
-                for _ in range(10):
-                    prev = prev.find_previous()
-                    if not prev:
-                        break
-                    txt = prev.get_text(" ", strip=True) if hasattr(prev, "get_text") else str(prev)
-                    mday2 = re.match(r"^(\d{1,2})\.\s*[A-Za-z]+$", txt)
-                    if mday2:
-                        current_day = int(mday2.group(1))
-                        break
-            if current_day is None:
-                continue
-            ev_date = resolve_calendar_date(month_name, year, current_day)
-            if not ev_date:
-                continue
-            start_time = start_str or "19:00"
-            start_dt = londonify(dtparse.parse(f"{ev_date.isoformat()} {start_time}", dayfirst=False))
-            end_dt = londonify(dtparse.parse(f"{ev_date.isoformat()} {end_str}", dayfirst=False)) if end_str else guess_end(start_dt, 4)
-            events.append(RBEvent(
-                title=title,
-                start=start_dt,
-                end=end_dt,
-                url=requests.compat.urljoin(DARKSPHERE_URL, node.get("href", "")),
-                store="Dark Sphere (Shepherd's Bush)",
-                location="Shepherd's Bush Megastore, London",
-            ))
+        if node.name == "a":
+            event = _darksphere_event(node, current_day, recent, short, month_name, year)
+            if event:
+                current_day = event[0]
+                events.append(event[1])
+        recent.append(node)
     return events
 
 
+def _darksphere_event(node: bs4.Tag, current_day: Optional[int], recent: deque, short: dict,
+                      month_name: str, year: int) -> Optional[Tuple[int, RBEvent]]:
+    """Build the event for one calendar link, returning (day, event) or None."""
+    title = node.get_text(" ", strip=True)
+    if not title or "riftbound" not in title.lower():
+        return None
+    # Look in the next few siblings for time information
+    time_text = ""
+    for sib in islice(node.next_siblings, 3):
+        if hasattr(sib, "get_text"):
+            time_text += " " + sib.get_text(" ", strip=True)
+        elif isinstance(sib, str):
+            time_text += " " + sib.strip()
+    start_str, end_str = parse_time_range(time_text)
+    if current_day is None:
+        # Search the preceding tags for a day header
+        for prev in reversed(recent):
+            if short[id(prev)] is None:
+                continue
+            mday = _DAY_HEADER_RE.match(prev.get_text(" ", strip=True))
+            if mday:
+                current_day = int(mday.group(1))
+                break
+    if current_day is None:
+        return None
+    ev_date = resolve_calendar_date(month_name, year, current_day)
+    if not ev_date:
+        return None
+    start_time = start_str or "19:00"
+    start_dt = at_time(ev_date, start_time)
+    end_dt = at_time(ev_date, end_str) if end_str else guess_end(start_dt, 4)
+    return current_day, RBEvent(
+        title=title,
+        start=start_dt,
+        end=end_dt,
+        url=requests.compat.urljoin(DARKSPHERE_URL, node.get("href", "")),
+        store=DARKSPHERE_STORE,
+        location="Shepherd's Bush Megastore, London",
+    )
+
+
 # ---- Generic Shopify helper (reused by Spellbound, Brotherhood, Leisure)
 
 def _extract_date_from_title(title: str, default_year: int) -> Optional[date]:
-    m = re.search(r"(\d{1,2})[/\-](\d{1,2})(?:[/\-](\d{2,4}))?", title)
-    if not m:
-        return None
-    d, mth, y = int(m.group(1)), int(m.group(2)), m.group(3)
-    year = (2000 + int(y)) if y and len(y) == 2 else (int(y) if y else default_year)
-    try:
-        return date(year, mth, d)
-    except ValueError:
-        return None
+    return scan_text(title).first_date(default_year)
 
 
 def _extract_date_loose(text: str, default_year: int) -> Optional[date]:
+    return _fuzzy_date(" ".join(text.split()), default_year)
+
+
+def _shopify_details_from_text(text: str, default_year: int) -> Tuple[Optional[date], Optional[str], Optional[str]]:
+    """Pull (date, start, end) out of a product description."""
     try:
-        dt = dtparse.parse(text, dayfirst=True, fuzzy=True, default=datetime(default_year, 1, 1))
-        return date(dt.year, dt.month, dt.day)
+        found = scan_text(text)
+        ev_date = found.first_date(default_year) or _extract_date_loose(text, default_year)
+        s, e = found.time_range()
+        return ev_date, s, e
     except Exception:
-        return None
+        return None, None, None
 
 
-def _scrape_shopify_products(hub_url: str, store_name: str, now: datetime) -> List[RBEvent]:
-    soup = fetch(hub_url)
-    events: List[RBEvent] = []
+def _shopify_product_details(psoup: bs4.BeautifulSoup, default_year: int) -> ProductDetail:
+    """Pull the date and times out of a Shopify product page."""
+    title = psoup.title.get_text(strip=True) if psoup.title else ""
+    ev_date, s, e = _shopify_details_from_text(psoup.get_text(" ", strip=True), default_year)
+    return ProductDetail(title=title, date=ev_date, start=s, end=e)
+
+
+def _shopify_candidates(soup: bs4.BeautifulSoup, hub_url: str, default_year: int) -> List[Tuple[str, str, Optional[date]]]:
+    """Return (title, product URL, date from title) for each Riftbound product link."""
+    candidates: List[Tuple[str, str, Optional[date]]] = []
     for a in soup.select("a[href*='/products/']"):
         title = a.get_text(" ", strip=True)
         href = a.get("href")
@@ -346,25 +1931,104 @@ def _scrape_shopify_products(hub_url: str, store_name: str, now: datetime) -> Li
         url = requests.compat.urljoin(hub_url, href)
         if "riftbound" not in (title or "").lower():
             continue
-        ev_date = _extract_date_from_title(title, now.year) or _extract_date_loose(title, now.year)
-        start_time, end_time = "19:00", "23:00"
+        ev_date = _extract_date_from_title(title, default_year) or _extract_date_loose(title, default_year)
+        candidates.append((title, url, ev_date))
+    return candidates
+
+
+# A product row is (title, URL, date, start time, end time); times may be None.
+ShopifyRow = Tuple[str, str, Optional[date], Optional[str], Optional[str]]
+
+# Shopify serves collections as paginated JSON at <collection>/products.json.
+SHOPIFY_JSON_LIMIT = 250
+SHOPIFY_JSON_MAX_PAGES = 10
+
+
+def _shopify_json_url(hub_url: str) -> Optional[str]:
+    """Return the products.json endpoint for a collection URL, if it is one."""
+    parts = urlsplit(hub_url)
+    if "/collections/" not in parts.path:
+        return None
+    return urlunsplit((parts.scheme, parts.netloc, parts.path.rstrip("/") + "/products.json", "", ""))
+
+
+def _shopify_rows_from_json(data: Any, hub_url: str, default_year: int) -> Tuple[int, List[ShopifyRow]]:
+    """
+    Turn one page of products.json into rows, returning (number of products
+    on the page, rows).  The date comes from the title when it has one,
+    otherwise from the description and variant names.
+    """
+    products = data.get("products") if isinstance(data, dict) else None
+    if not isinstance(products, list):
+        raise ValueError("not a Shopify products feed")
+    rows: List[ShopifyRow] = []
+    for product in products:
+        title = " ".join((product.get("title") or "").split())
+        handle = product.get("handle")
+        if not handle or "riftbound" not in title.lower():
+            continue
+        url = requests.compat.urljoin(hub_url, f"/products/{handle}")
+        ev_date = _extract_date_from_title(title, default_year) or _extract_date_loose(title, default_year)
+        s = e = None
         if ev_date is None:
-            # Try to extract date/time from the product page
-            try:
-                psoup = fetch(url)
-                body = psoup.get_text(" ", strip=True)
-                ev_date = _extract_date_from_title(body, now.year) or _extract_date_loose(body, now.year)
-                s, e = parse_time_range(body)
-                if s:
-                    start_time = s
-                if e:
-                    end_time = e
-            except Exception:
-                pass
+            body = _parse(product.get("body_html") or "").get_text(" ", strip=True)
+            variants = [v.get("title") or "" for v in product.get("variants") or []]
+            ev_date, s, e = _shopify_details_from_text(" ".join([body] + variants), default_year)
+        rows.append((title, url, ev_date, s, e))
+    return len(products), rows
+
+
+def _shopify_rows_json(hub_url: str, now: datetime) -> List[ShopifyRow]:
+    """Read the collection through products.json; raises if it isn't available."""
+    json_url = _shopify_json_url(hub_url)
+    if json_url is None:
+        raise ValueError(f"{hub_url} is not a Shopify collection")
+    rows: List[ShopifyRow] = []
+    for page in range(1, SHOPIFY_JSON_MAX_PAGES + 1):
+        count, page_rows = fetch_page(
+            f"{json_url}?limit={SHOPIFY_JSON_LIMIT}&page={page}",
+            lambda data, _url: _shopify_rows_from_json(data, hub_url, now.year),
+            variant=str(now.year),
+            parse=json.loads,
+        )
+        rows.extend(page_rows)
+        if count < SHOPIFY_JSON_LIMIT:
+            break
+    return rows
+
+
+def _shopify_rows_html(hub_url: str, now: datetime) -> List[ShopifyRow]:
+    """Read the collection page, visiting product pages for undated titles."""
+    candidates = fetch_page(hub_url, lambda soup, url: _shopify_candidates(soup, url, now.year),
+                            variant=str(now.year), parse=_parse_links)
+    # Try to extract date/time from the product page where the title has none
+    pending = list(dict.fromkeys(url for _, url, ev_date in candidates if ev_date is None))
+    found = fetch_product_details(pending, lambda ps, _url: _shopify_product_details(ps, now.year), now)
+    details = dict(zip(pending, found))
+    rows: List[ShopifyRow] = []
+    for title, url, ev_date in candidates:
+        s = e = None
+        if ev_date is None and details.get(url):
+            detail = details[url]
+            ev_date, s, e = detail.date, detail.start, detail.end
+        rows.append((title, url, ev_date, s, e))
+    return rows
+
+
+def _scrape_shopify_products(hub_url: str, store_name: str, now: datetime) -> List[RBEvent]:
+    try:
+        rows = _shopify_rows_json(hub_url, now)
+    except (requests.RequestException, ValueError):
+        # Not Shopify, or the JSON endpoint is disabled: scrape the HTML instead
+        rows = _shopify_rows_html(hub_url, now)
+    events: List[RBEvent] = []
+    for title, url, ev_date, s, e in rows:
         if ev_date is None:
             continue
-        start_dt = londonify(dtparse.parse(f"{ev_date.isoformat()} {start_time}", dayfirst=False))
-        end_dt = londonify(dtparse.parse(f"{ev_date.isoformat()} {end_time}", dayfirst=False))
+        start_time = s or "19:00"
+        end_time = e or "23:00"
+        start_dt = at_time(ev_date, start_time)
+        end_dt = at_time(ev_date, end_time)
         events.append(RBEvent(
             title=title,
             start=start_dt,
@@ -379,30 +2043,34 @@ def _scrape_shopify_products(hub_url: str, store_name: str, now: datetime) -> Li
 
 # ---- Spellbound Games (Shopify)
 SPELLBOUND_COLLECTION = "https://spellboundgames.co.uk/collections/events"
+SPELLBOUND_STORE = "Spellbound Games (London)"
 
 def scrape_spellbound(now: datetime) -> List[RBEvent]:
-    return _scrape_shopify_products(SPELLBOUND_COLLECTION, "Spellbound Games (London)", now)
+    return _scrape_shopify_products(SPELLBOUND_COLLECTION, SPELLBOUND_STORE, now)
 
 
 # ---- The Brotherhood Games (Shopify)
 BROTHERHOOD_EVENTS = "https://thebrotherhoodgames.co.uk/product-category/events/"
+BROTHERHOOD_STORE = "The Brotherhood Games (Bermondsey)"
 
 def scrape_brotherhood(now: datetime) -> List[RBEvent]:
-    return _scrape_shopify_products(BROTHERHOOD_EVENTS, "The Brotherhood Games (Bermondsey)", now)
+    return _scrape_shopify_products(BROTHERHOOD_EVENTS, BROTHERHOOD_STORE, now)
 
 
 # ---- Leisure Games (Shopify)
 LEISURE_TICKETS = "https://leisuregames.com/collections/tickets"
+LEISURE_STORE = "Leisure Games (Finchley)"
 
 def scrape_leisure(now: datetime) -> List[RBEvent]:
-    return _scrape_shopify_products(LEISURE_TICKETS, "Leisure Games (Finchley)", now)
+    return _scrape_shopify_products(LEISURE_TICKETS, LEISURE_STORE, now)
 
 
 # ---- Zombie Games Café (Wix)
 ZOMBIE_TICKETS = "https://www.zombiegamescafe.com/tcg-events-tickets"
 ZOMBIE_ALL_TICKETS = "https://www.zombiegamescafe.com/all-tcg-event-tickets"
+ZOMBIE_STORE = "Zombie Games Café (Cricklewood)"
 
-def _zombie_collect_product_links(soup: BeautifulSoup) -> List[str]:
+def _zombie_collect_product_links(soup: bs4.BeautifulSoup) -> List[str]:
     links: List[str] = []
     for a in soup.find_all("a", href=True):
         href = a["href"]
@@ -414,58 +2082,52 @@ def _zombie_collect_product_links(soup: BeautifulSoup) -> List[str]:
 
 
 def _extract_dt_from_text(text: str, default_year: int) -> Tuple[Optional[date], Optional[str], Optional[str]]:
-    txt = " ".join(text.split())
-    tm = re.search(r"(\d{1,2}:\d{2}\s*(?:am|pm)?)", txt, re.I)
-    dm = re.search(r"(\d{1,2})[/-](\d{1,2})(?:[/-](\d{2,4}))?", txt)
-    start_time = tm.group(1) if tm else None
-    ev_date = None
-    if dm:
-        d, mth, y = int(dm.group(1)), int(dm.group(2)), dm.group(3)
-        year = (2000 + int(y)) if y and len(y) == 2 else (int(y) if y else default_year)
-        try:
-            ev_date = date(year, mth, d)
-        except ValueError:
-            ev_date = None
-    return ev_date, start_time, None
+    found = scan_text(" ".join(text.split()))
+    return found.first_date(default_year), found.first_time(), None
+
+
+def _zombie_product_detail(psoup: bs4.BeautifulSoup, url: str, default_year: int) -> ProductDetail:
+    title = psoup.title.get_text(strip=True) if psoup.title else url
+    body = psoup.get_text(" ", strip=True)
+    if "riftbound" not in (title + " " + body).lower():
+        return ProductDetail(title=title, date=None)
+    ev_date, start_time, end_time = _extract_dt_from_text(title + " " + body, default_year)
+    return ProductDetail(title=title, date=ev_date, start=start_time, end=end_time)
+
+
+def _zombie_event(url: str, detail: ProductDetail) -> Optional[RBEvent]:
+    if not detail.date:
+        return None
+    start_time = detail.start or "18:30"
+    start_dt = at_time(detail.date, start_time)
+    end_dt = at_time(detail.date, detail.end) if detail.end else guess_end(start_dt, 3)
+    return RBEvent(
+        title=detail.title,
+        start=start_dt,
+        end=end_dt,
+        url=url,
+        store=ZOMBIE_STORE,
+        location="Zombie Games Café, London",
+    )
 
 
 def scrape_zombie(now: datetime) -> List[RBEvent]:
-    events: List[RBEvent] = []
-    for hub in (ZOMBIE_TICKETS, ZOMBIE_ALL_TICKETS):
-        try:
-            hub_soup = fetch(hub)
-        except Exception:
-            continue
-        for url in _zombie_collect_product_links(hub_soup):
-            try:
-                psoup = fetch(url)
-            except Exception:
-                continue
-            title = psoup.title.get_text(strip=True) if psoup.title else url
-            body = psoup.get_text(" ", strip=True)
-            if "riftbound" not in (title + " " + body).lower():
-                continue
-            ev_date, start_time, end_time = _extract_dt_from_text(title + " " + body, now.year)
-            if not ev_date:
-                continue
-            start_time = start_time or "18:30"
-            start_dt = londonify(dtparse.parse(f"{ev_date.isoformat()} {start_time}", dayfirst=False))
-            end_dt = londonify(dtparse.parse(f"{ev_date.isoformat()} {end_time}", dayfirst=False)) if end_time else guess_end(start_dt, 3)
-            events.append(RBEvent(
-                title=title,
-                start=start_dt,
-                end=end_dt,
-                url=url,
-                store="Zombie Games Café (Cricklewood)",
-                location="Zombie Games Café, London",
-            ))
+    # Both hubs list many of the same products; fetch each one only once.
+    links: List[str] = []
+    hubs = [ZOMBIE_TICKETS, ZOMBIE_ALL_TICKETS]
+    for hub_links in fetch_many(hubs, lambda soup, _url: _zombie_collect_product_links(soup), parse=_parse_links):
+        links.extend(hub_links or [])
+    links = list(dict.fromkeys(links))
+    details = fetch_product_details(links, lambda psoup, url: _zombie_product_detail(psoup, url, now.year), now)
+    events = [ev for ev in (_zombie_event(url, d) for url, d in zip(links, details) if d) if ev]
     return list({(e.title, e.start): e for e in events}.values())
 
 
 # ---- Europa Gaming (standalone pages)
 EUROPA_HOME = "https://www.europagaming.co.uk/"
+EUROPA_STORE = "Europa Gaming (Wembley)"
 
-def _europa_collect_event_links(soup: BeautifulSoup) -> List[str]:
+def _europa_collect_event_links(soup: bs4.BeautifulSoup) -> List[str]:
     links: List[str] = []
     for a in soup.find_all("a", href=True):
         href = a["href"]
@@ -475,12 +2137,40 @@ def _europa_collect_event_links(soup: BeautifulSoup) -> List[str]:
     return list(dict.fromkeys(links))
 
 
+def _europa_event_detail(psoup: bs4.BeautifulSoup, url: str, default_year: int) -> ProductDetail:
+    title = psoup.title.get_text(strip=True) if psoup.title else url
+    body = psoup.get_text(" ", strip=True)
+    if "riftbound" not in (title + " " + body).lower():
+        return ProductDetail(title=title, date=None)
+    found = scan_text(body)
+    s, e = found.time_range()
+    evd = _extract_date_from_title(title, default_year) or _extract_date_loose(title, default_year)
+    if not evd:
+        evd = found.first_date(default_year) or _extract_date_loose(body, default_year)
+    return ProductDetail(title=title, date=evd, start=s, end=e)
+
+
+def _europa_event(url: str, detail: ProductDetail) -> Optional[RBEvent]:
+    if not detail.date:
+        return None
+    start_time = detail.start or "13:00"
+    start_dt = at_time(detail.date, start_time)
+    end_dt = at_time(detail.date, detail.end) if detail.end else guess_end(start_dt, 4)
+    return RBEvent(
+        title=detail.title,
+        start=start_dt,
+        end=end_dt,
+        url=url,
+        store=EUROPA_STORE,
+        location="Europa Gaming, Wembley",
+    )
+
+
 def scrape_europa(now: datetime) -> List[RBEvent]:
-    events: List[RBEvent] = []
     try:
-        home = fetch(EUROPA_HOME)
-        hrefs = _europa_collect_event_links(home)
+        hrefs = fetch_page(EUROPA_HOME, lambda soup, _url: _europa_collect_event_links(soup), parse=_parse_links)
     except Exception:
+        _note_missed()
         hrefs = []
     if not hrefs:
         # Fallback to known pages if the navigation fails
@@ -488,44 +2178,24 @@ def scrape_europa(now: datetime) -> List[RBEvent]:
             "https://www.europagaming.co.uk/event-details-registration/riftbound-release-event",
             "https://www.europagaming.co.uk/event-details-registration/riftbound-summoner-skirmish-europa-gaming-2025-12-13-13-00",
         ]
-    for url in hrefs:
-        try:
-            psoup = fetch(url)
-        except Exception:
-            continue
-        title = psoup.title.get_text(strip=True) if psoup.title else url
-        body = psoup.get_text(" ", strip=True)
-        if "riftbound" not in (title + " " + body).lower():
-            continue
-        s, e = parse_time_range(body)
-        evd = _extract_date_from_title(title, now.year) or _extract_date_loose(title, now.year)
-        if not evd:
-            evd = _extract_date_from_title(body, now.year) or _extract_date_loose(body, now.year)
-        if not evd:
-            continue
-        start_time = s or "13:00"
-        start_dt = londonify(dtparse.parse(f"{evd.isoformat()} {start_time}", dayfirst=False))
-        end_dt = londonify(dtparse.parse(f"{evd.isoformat()} {e}", dayfirst=False)) if e else guess_end(start_dt, 4)
-        events.append(RBEvent(
-            title=title,
-            start=start_dt,
-            end=end_dt,
-            url=url,
-            store="Europa Gaming (Wembley)",
-            location="Europa Gaming, Wembley",
-        ))
+    details = fetch_product_details(hrefs, lambda psoup, url: _europa_event_detail(psoup, url, now.year), now)
+    events = [ev for ev in (_europa_event(url, d) for url, d in zip(hrefs, details) if d) if ev]
     return list({(e.title, e.start): e for e in events}.values())
 
 
 # ---------------------------------------------------------------------------
 # De‑duplication
 
+_TITLE_PUNCT_RE = re.compile(r"[-–:]+")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
 def _canonical_title(title: str) -> str:
     """Normalize titles for comparison (lowercase, unify Nexus plural)."""
     t = title.lower()
-    t = re.sub(r"[-–:]+", " ", t)
+    t = _TITLE_PUNCT_RE.sub(" ", t)
     t = t.replace("nexus nights", "nexus night")
-    t = re.sub(r"\s+", " ", t).strip()
+    t = _WHITESPACE_RE.sub(" ", t).strip()
     return t
 
 
@@ -568,16 +2238,125 @@ def _dedup_slot_conflicts(events: List[RBEvent]) -> List[RBEvent]:
 # ---------------------------------------------------------------------------
 # Export functions
 
-def export_ics(events: List[RBEvent], path: str) -> None:
-    """Write an .ics calendar containing the given events."""
-    cal = Calendar()
+# .ics files are written by a small streaming RFC 5545 writer: each VEVENT is
+# generated straight from its RBEvent, lines are folded at 75 octets and TEXT
+# values escaped.  Times are local Europe/London times with a matching
+# VTIMEZONE.  Output is byte‑stable for the same events: they are written in
+# (start, store, UID) order, UIDs are stable_id() and DTSTAMP is when the
+# event was first seen (from the event store; ICS_DTSTAMP for events it
+# doesn't know) rather than the time of the export.  RIFTBOUND_ICS_WRITER=ics
+# uses the ics package instead, if it is installed.
+
+ICS_WRITER = os.environ.get("RIFTBOUND_ICS_WRITER", "native")
+ICS_PRODID = "-//Riftbound Watcher//riftbound_watcher.py//EN"
+ICS_LINE_OCTETS = 75
+ICS_DTSTAMP = datetime(2025, 1, 1, tzinfo=timezone.utc)
+ICS_VTIMEZONE = (
+    "BEGIN:VTIMEZONE",
+    "TZID:Europe/London",
+    "BEGIN:DAYLIGHT",
+    "TZOFFSETFROM:+0000",
+    "TZOFFSETTO:+0100",
+    "TZNAME:BST",
+    "DTSTART:19700329T010000",
+    "RRULE:FREQ=YEARLY;BYMONTH=3;BYDAY=-1SU",
+    "END:DAYLIGHT",
+    "BEGIN:STANDARD",
+    "TZOFFSETFROM:+0100",
+    "TZOFFSETTO:+0000",
+    "TZNAME:GMT",
+    "DTSTART:19701025T020000",
+    "RRULE:FREQ=YEARLY;BYMONTH=10;BYDAY=-1SU",
+    "END:STANDARD",
+    "END:VTIMEZONE",
+)
+_ICS_ESCAPES = str.maketrans({"\\": "\\\\", ";": "\\;", ",": "\\,", "\n": "\\n", "\r": ""})
+
+
+def _ics_text(value: str) -> str:
+    return value.translate(_ICS_ESCAPES)
+
+
+def _ics_fold(line: str) -> str:
+    """Fold a content line to at most 75 octets per line, without splitting a UTF‑8 character."""
+    if len(line.encode("utf-8")) <= ICS_LINE_OCTETS:
+        return line + "\r\n"
+    parts: List[str] = []
+    current: List[str] = []
+    size = 0
+    limit = ICS_LINE_OCTETS
+    for ch in line:
+        n = len(ch.encode("utf-8"))
+        if size + n > limit:
+            parts.append("".join(current))
+            current, size, limit = [], 0, ICS_LINE_OCTETS - 1  # continuation lines start with a space
+        current.append(ch)
+        size += n
+    parts.append("".join(current))
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def _ics_local(dt: datetime) -> str:
+    return dt.astimezone(LONDON_TZ).strftime("%Y%m%dT%H%M%S")
+
+
+def _ics_summary(ev: RBEvent) -> str:
+    name = f"{ev.store}: {ev.title}"
+    tag = _op_tag_for(ev.title)
+    return f"[{tag}] {name}" if tag else name
+
+
+def ics_lines(events: List[RBEvent], stamps: Optional[dict] = None) -> Iterator[str]:
+    """
+    Yield the folded, CRLF‑terminated lines of an .ics calendar for
+    ``events``.  ``stamps`` maps stable_id() to the DTSTAMP to use (see
+    EventStore.first_seen); other events get ICS_DTSTAMP.
+    """
+    stamps = stamps or {}
+    for line in ("BEGIN:VCALENDAR", "VERSION:2.0", f"PRODID:{ICS_PRODID}", "CALSCALE:GREGORIAN",
+                 "X-WR-TIMEZONE:Europe/London", *ICS_VTIMEZONE):
+        yield line + "\r\n"
+    written = set()
+    for ev in sorted(events, key=lambda e: (e.start, e.store, e.stable_id())):
+        uid = ev.stable_id()
+        if uid in written:
+            continue
+        written.add(uid)
+        yield "BEGIN:VEVENT\r\n"
+        yield f"UID:{uid}\r\n"
+        yield f"DTSTAMP:{stamps.get(uid, ICS_DTSTAMP).astimezone(timezone.utc):%Y%m%dT%H%M%SZ}\r\n"
+        yield f"DTSTART;TZID=Europe/London:{_ics_local(ev.start)}\r\n"
+        if ev.end:
+            yield f"DTEND;TZID=Europe/London:{_ics_local(ev.end)}\r\n"
+        yield _ics_fold(f"SUMMARY:{_ics_text(_ics_summary(ev))}")
+        yield _ics_fold(f"LOCATION:{_ics_text(ev.location or ev.store)}")
+        if ev.url:
+            yield _ics_fold(f"URL:{ev.url}")
+        yield "END:VEVENT\r\n"
+    yield "END:VCALENDAR\r\n"
+
+
+def export_ics(events: List[RBEvent], path: str, writer: Optional[str] = None,
+               stamps: Optional[dict] = None) -> None:
+    """Write an .ics calendar containing the given events (``stamps`` as for ics_lines)."""
+    if (writer or ICS_WRITER) == "ics":
+        try:
+            ics.Calendar
+        except ImportError:
+            print("[warn] The ics package is not installed; writing the calendar with the built-in writer")
+        else:
+            _export_ics_package(events, path)
+            return
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.writelines(ics_lines(events, stamps))
+
+
+def _export_ics_package(events: List[RBEvent], path: str) -> None:
+    """The original writer, built on the ``ics`` package."""
+    cal = ics.Calendar()
     for ev in events:
-        name = f"{ev.store}: {ev.title}"
-        tag = _op_tag_for(ev.title)
-        if tag:
-            name = f"[{tag}] {name}"
-        ics_ev = IcsEvent()
-        ics_ev.name = name
+        ics_ev = ics.Event()
+        ics_ev.name = _ics_summary(ev)
         ics_ev.begin = ev.start
         if ev.end:
             ics_ev.end = ev.end
@@ -611,85 +2390,436 @@ def export_csv(events: List[RBEvent], path: str) -> None:
 # ---------------------------------------------------------------------------
 # Main orchestration
 
-def find_events(now: Optional[datetime] = None) -> List[RBEvent]:
+# Each source is a (label, scraper, stores) triple.  The label is used in
+# ``[warn]`` messages; ``stores`` are the store names its events carry; the
+# order here is the order results are merged in.
+SOURCES = [
+    ("Dark Sphere", scrape_darksphere, (DARKSPHERE_STORE,)),
+    ("Spellbound", scrape_spellbound, (SPELLBOUND_STORE,)),
+    ("Brotherhood", scrape_brotherhood, (BROTHERHOOD_STORE,)),
+    ("Leisure Games", scrape_leisure, (LEISURE_STORE,)),
+    ("Zombie Games", scrape_zombie, (ZOMBIE_STORE,)),
+    ("Europa Gaming", scrape_europa, (EUROPA_STORE,)),
+]
+
+# What scrape_sources returns per source: (label, events or None if the
+# scrape failed, whether every page it needed was fetched).
+SourceResult = Tuple[str, Optional[List[RBEvent]], bool]
+
+# Number of sources scraped in parallel.  Set RIFTBOUND_WORKERS=1 to run them
+# one after another as before.
+DEFAULT_WORKERS = int(os.environ.get("RIFTBOUND_WORKERS", len(SOURCES)))
+
+
+def _run_source(label: str, scraper, now: datetime) -> Tuple[Optional[List[RBEvent]], bool]:
     """
-    Scrape all configured sources and return a deduplicated list of upcoming events
-    starting from yesterday onwards (for midnight cross‑over safety).
+    Run one scraper, reporting (not raising) any failure.  Returns its
+    events (None if it failed) and whether no page had to be skipped.
     """
-    now = londonify(now or datetime.now(tz=LONDON_TZ))
-    evs: List[RBEvent] = []
-    # We wrap each scraper in try/except so one failing source doesn't kill the whole run.
-    try:
-        evs.extend(scrape_darksphere(now))
-    except Exception as e:
-        print(f"[warn] Dark Sphere scrape failed: {e}")
-    try:
-        evs.extend(scrape_spellbound(now))
-    except Exception as e:
-        print(f"[warn] Spellbound scrape failed: {e}")
+    _MISSED.pages = 0
     try:
-        evs.extend(scrape_brotherhood(now))
+        events = scraper(now)
     except Exception as e:
-        print(f"[warn] Brotherhood scrape failed: {e}")
-    try:
-        evs.extend(scrape_leisure(now))
-    except Exception as e:
-        print(f"[warn] Leisure Games scrape failed: {e}")
-    try:
-        evs.extend(scrape_zombie(now))
-    except Exception as e:
-        print(f"[warn] Zombie Games scrape failed: {e}")
-    try:
-        evs.extend(scrape_europa(now))
-    except Exception as e:
-        print(f"[warn] Europa Gaming scrape failed: {e}")
+        print(f"[warn] {label} scrape failed: {e}")
+        return None, False
+    if _MISSED.pages:
+        print(f"[warn] {label}: {_MISSED.pages} pages could not be fetched")
+    return events, not _MISSED.pages
+
+
+def scrape_sources(now: datetime, workers: Optional[int] = None, budget: Optional[float] = None,
+                   sources: Optional[list] = None) -> List[SourceResult]:
+    """
+    Scrape all configured sources (or just ``sources``, a subset of
+    ``SOURCES``) and return ``(label, events, complete)`` in ``SOURCES``
+    order, with ``events`` None for a source whose scrape failed and
+    ``complete`` False if it had to skip pages.
+
+    Sources are scraped concurrently on a pool of ``workers`` threads
+    (default ``DEFAULT_WORKERS``).  Each source is isolated so one failing
+    site doesn't kill the whole run, and results are returned in order
+    regardless of which site answers first.
+
+    ``budget`` (default ``DEFAULT_BUDGET``) caps the wall‑clock seconds spent
+    fetching; see ``set_run_budget``.
+    """
+    sources = SOURCES if sources is None else sources
+    workers = max(1, workers or DEFAULT_WORKERS)
+    set_run_budget(budget if budget is not None else DEFAULT_BUDGET)
+    if workers == 1 or len(sources) <= 1:
+        results = [_run_source(label, scraper, now) for label, scraper, _ in sources]
+    else:
+        with ThreadPoolExecutor(max_workers=min(workers, len(sources))) as pool:
+            futures = [pool.submit(_run_source, label, scraper, now) for label, scraper, _ in sources]
+            results = [f.result() for f in futures]
+    return [(label, events, complete) for (label, _, _), (events, complete) in zip(sources, results)]
+
+
+def _merge_events(results: List[SourceResult], now: datetime) -> List[RBEvent]:
+    evs: List[RBEvent] = [ev for _, batch, _ in results for ev in batch or ()]
     # Keep only events starting yesterday or later
     evs = [e for e in evs if e.start >= (now - timedelta(days=1))]
     return _dedup_slot_conflicts(evs)
 
 
-def run_once(post: bool = True) -> List[RBEvent]:
+def find_events(now: Optional[datetime] = None, workers: Optional[int] = None,
+                budget: Optional[float] = None, sources: Optional[list] = None) -> List[RBEvent]:
     """
-    Scrape events and optionally post newly discovered ones to Discord.
-    Returns the full list of events discovered.
+    Scrape sources (see ``scrape_sources``) and return a deduplicated list of
+    upcoming events starting from yesterday onwards (for midnight
+    cross‑over safety).
     """
+    now = londonify(now or datetime.now(tz=LONDON_TZ))
+    return _merge_events(scrape_sources(now, workers=workers, budget=budget, sources=sources), now)
+
+
+def run_once(post: bool = True, workers: Optional[int] = None, budget: Optional[float] = None,
+             lock_wait: Optional[float] = None, all_sources: bool = False) -> List[RBEvent]:
+    """
+    Scrape the sources that are due (every source if ``all_sources``) and
+    optionally post newly discovered events to Discord.  Returns the list of
+    events discovered.  Raises StateLocked if another run still holds the
+    state lock after ``lock_wait`` seconds.
+    """
+    with state_lock(lock_wait):
+        return _run_locked(post, workers, budget, all_sources)
+
+
+def _run_locked(post: bool, workers: Optional[int], budget: Optional[float],
+                all_sources: bool) -> List[RBEvent]:
     seen = load_state()
+    store = EventStore()
     now = londonify(datetime.now(tz=LONDON_TZ))
-    events = find_events(now)
+    sources = SOURCES if all_sources else [src for src in SOURCES if SCHEDULE.due(src[0], now)]
+    results = scrape_sources(now, workers=workers, budget=budget, sources=sources)
+    events = _merge_events(results, now)
+    new_events = _process_events(events, now, seen, store, post, _scraped_stores(results))
+    SCHEDULE.observe(results, new_events, now)
+    store.close()
+    OUTBOX.report()
+    SCHEDULE.save()
+    SCHEDULE.report(now)
+    _save_caches(report=True)
+    return events
+
+
+def _scraped_stores(results: List[SourceResult]) -> Set[str]:
+    """Stores of the sources that were scraped in full (no failure, no skipped page)."""
+    stores = {label: names for label, _, names in SOURCES}
+    return {name for label, events, complete in results if events is not None and complete
+            for name in stores.get(label, ())}
+
+
+def _process_events(events: List[RBEvent], now: datetime, seen: dict, store: EventStore,
+                    post: bool, scraped: Iterable[str] = ()) -> List[RBEvent]:
+    """
+    Announce the events not seen before and persist state; return the new
+    ones.  ``scraped`` is passed on to EventStore.record.
+    """
     new_events: List[RBEvent] = []
     for ev in events:
-        if ev.uid() in seen or ev.stable_id() in seen:
+        if ev.uid() in seen or ev.stable_id() in seen or store.is_notified(ev) or ev in OUTBOX:
             continue
         new_events.append(ev)
-    for ev in sorted(new_events, key=lambda e: e.start):
+    for ev in events:
+        # keep start times current so entries expire with their event
+        for key in (ev.uid(), ev.stable_id()):
+            if key in seen:
+                seen[key] = ev.start
+    new_events.sort(key=lambda e: e.start)
+    for ev in new_events:
         print(f"NEW: {ev.start:%Y-%m-%d %H:%M} — {ev.store} — {ev.title}\n{ev.url}\n")
-        if post:
-            post_discord(ev)
+    if post:
+        index = DestinationIndex(load_destinations())
+        OUTBOX.enqueue(new_events, index)
+        OUTBOX.save()
+        notified = OUTBOX.drain(index, now)
+    else:
+        notified = new_events
+    for ev in notified:
         # record both UID forms so title changes won't re‑post
-        seen.add(ev.uid())
-        seen.add(ev.stable_id())
+        seen[ev.uid()] = ev.start
+        seen[ev.stable_id()] = ev.start
+    expired = prune_state(seen, now)
     save_state(seen)
-    return events
+    print(f"[state] {len(seen)} IDs kept, {expired} expired")
+    store.record(events, now, notified=notified, scraped=scraped)
+    OUTBOX.save()
+    return new_events
+
+
+def _save_caches(report: bool = False) -> None:
+    PAGE_CACHE.save()
+    PRODUCT_CACHE.save()
+    if not report:
+        return
+    PAGE_CACHE.report()
+    PRODUCT_CACHE.report()
+    report_date_stats()
+    HOSTS.report()
+    stats = http_stats()
+    print(f"[http] {stats['requests']} requests over {stats['connections']} connections ({stats['reused']} reused)")
+
+
+# ---------------------------------------------------------------------------
+# Adaptive polling
+#
+# Each source gets its own poll interval, learned across runs and kept in
+# SCHEDULE_PATH.  After every scrape the source's events are hashed; if the
+# hash changed or new events appeared the interval halves, otherwise it grows
+# by half, always within [POLL_MIN, POLL_MAX] minutes.  Within RELEASE_WINDOW
+# of a release date (RIFTBOUND_RELEASE_DATES, plus the dates of any scraped
+# "release event") every source is polled at POLL_MIN.  ``run`` only scrapes
+# sources that are due (``--all-sources`` scrapes all of them), with up to
+# SCHEDULE_SLACK minutes of tolerance for late cron starts.  Intervals given
+# in RIFTBOUND_SOURCE_INTERVALS ("label=minutes,...") are fixed instead.
+
+SCHEDULE_PATH = os.path.join(DATA_DIR, "schedule.json")
+POLL_MIN = float(os.environ.get("RIFTBOUND_POLL_MIN", "30"))
+POLL_MAX = float(os.environ.get("RIFTBOUND_POLL_MAX", str(24 * 60)))
+POLL_SPEEDUP = 0.5
+POLL_SLOWDOWN = 1.5
+SCHEDULE_SLACK = 15.0
+RELEASE_WINDOW = timedelta(days=float(os.environ.get("RIFTBOUND_RELEASE_WINDOW_DAYS", "7")))
+RELEASE_DATES = [
+    date.fromisoformat(d.strip()) for d in os.environ.get("RIFTBOUND_RELEASE_DATES", "").split(",") if d.strip()
+]
+
+
+def _parse_source_intervals(spec: str) -> dict:
+    intervals = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        label, _, minutes = item.partition("=")
+        intervals[label.strip()] = max(1.0, float(minutes))
+    return intervals
+
+
+SOURCE_INTERVALS = _parse_source_intervals(os.environ.get("RIFTBOUND_SOURCE_INTERVALS", ""))
+
+
+def _events_digest(events: List[RBEvent]) -> str:
+    return hashlib.sha1("\n".join(sorted(ev.uid() for ev in events)).encode("utf-8")).hexdigest()
+
+
+def _is_release(event: RBEvent) -> bool:
+    return (_op_tag_for(event.title) or "").endswith("RELEASE EVENT")
+
+
+class SourceSchedule:
+    """Persistent per‑source poll intervals learned from how often sources change."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.entries: Optional[dict] = None
+        self.decisions: List[Tuple[str, str]] = []
+
+    def _load(self) -> dict:
+        if self.entries is None:
+            self.entries = {"sources": {}, "releases": [], **_read_json(self.path, {})}
+        return self.entries
+
+    def near_release(self, now: datetime) -> bool:
+        today = now.date()
+        known = RELEASE_DATES + [date.fromisoformat(d) for d in self._load()["releases"]]
+        return any(abs(day - today) <= RELEASE_WINDOW for day in known)
+
+    def interval(self, label: str, now: datetime, pinned: Optional[float] = None) -> float:
+        """Minutes between scrapes of ``label``."""
+        pinned = pinned or SOURCE_INTERVALS.get(label)
+        if pinned:
+            return pinned
+        learned = self._load()["sources"].get(label, {}).get("interval", POLL_MIN)
+        return POLL_MIN if self.near_release(now) else min(max(learned, POLL_MIN), POLL_MAX)
+
+    def next_due(self, label: str, now: datetime, pinned: Optional[float] = None) -> datetime:
+        entry = self._load()["sources"].get(label)
+        if not entry:
+            return now
+        last = datetime.fromisoformat(entry["checked"])
+        interval = self.interval(label, now, pinned)
+        return last + timedelta(minutes=interval - min(SCHEDULE_SLACK, interval / 4))
+
+    def due(self, label: str, now: datetime, pinned: Optional[float] = None) -> bool:
+        return self.next_due(label, now, pinned) <= now
+
+    def observe(self, results: List[SourceResult], new_events: List[RBEvent],
+                now: datetime) -> None:
+        """Learn from one pass: ``results`` as from scrape_sources, ``new_events`` as announced."""
+        data = self._load()
+        new_ids = {ev.uid() for ev in new_events}
+        releases = set(data["releases"])
+        for label, events, _ in results:
+            entry = data["sources"].setdefault(label, {"interval": POLL_MIN, "checks": 0, "changes": 0})
+            if events is None:
+                # failed: try again after the current interval, learn nothing
+                entry["checked"] = now.isoformat()
+                self.decisions.append((label, "failed"))
+                continue
+            digest = _events_digest(events)
+            new = sum(ev.uid() in new_ids for ev in events)
+            changed = new > 0 or ("digest" in entry and digest != entry["digest"])
+            factor = POLL_SPEEDUP if changed else POLL_SLOWDOWN
+            entry["interval"] = min(max(entry["interval"] * factor, POLL_MIN), POLL_MAX)
+            entry["checks"] += 1
+            entry["changes"] += changed
+            entry["digest"] = digest
+            entry["checked"] = now.isoformat()
+            if changed:
+                entry["changed"] = now.isoformat()
+            releases.update(ev.start.date().isoformat() for ev in events if _is_release(ev))
+            what = f"changed, {new} new" if changed else "unchanged"
+            self.decisions.append((label, f"{what}; {entry['changes']}/{entry['checks']} checks changed"))
+        data["releases"] = sorted(d for d in releases if date.fromisoformat(d) >= now.date() - RELEASE_WINDOW)
+
+    def save(self) -> None:
+        if self.entries is not None:
+            _write_json(self.path, self.entries)
+
+    def report(self, now: datetime, pinned: Optional[float] = None) -> None:
+        decided = dict(self.decisions)
+        for label, _, _ in SOURCES:
+            what = decided.get(label, "not due")
+            interval = self.interval(label, now, pinned)
+            next_at = self.next_due(label, now, pinned) + timedelta(minutes=min(SCHEDULE_SLACK, interval / 4))
+            print(f"[schedule] {label}: {what}; every {interval:.0f} min, next {next_at:%a %H:%M}")
+        if self.near_release(now):
+            print("[schedule] release window: polling every source at the minimum interval")
+        self.decisions = []
+
+
+SCHEDULE = SourceSchedule(SCHEDULE_PATH)
+
+
+# ---------------------------------------------------------------------------
+# Watch mode
+#
+# ``watch`` keeps one process running: the HTTP pool, page and product caches,
+# seen state and event store stay in memory, and each source is re‑scraped
+# whenever the adaptive schedule says it is due (or every ``--interval``
+# minutes, if given).  The state lock is held for the life of the process,
+# so a cron ``run`` started alongside it exits straight away.  SIGTERM or
+# SIGINT finish the current pass, save everything and exit.
+
+
+def watch(post: bool = True, interval: Optional[float] = None, workers: Optional[int] = None,
+          budget: Optional[float] = None, lock_wait: Optional[float] = None) -> None:
+    """
+    Scrape each source when it is due (every ``interval`` minutes if given,
+    else per SourceSchedule) until SIGTERM/SIGINT.  Raises StateLocked like
+    run_once.
+    """
+    stop = threading.Event()
+    previous = {sig: signal.signal(sig, lambda *_: stop.set()) for sig in (signal.SIGTERM, signal.SIGINT)}
+    try:
+        with state_lock(lock_wait):
+            seen = load_state()
+            store = EventStore()
+            mode = f"every {interval:g} min" if interval else "adaptive intervals"
+            print(f"[watch] watching {len(SOURCES)} sources; {mode}")
+            while not stop.is_set():
+                now = londonify(datetime.now(tz=LONDON_TZ))
+                ready = [src for src in SOURCES if SCHEDULE.due(src[0], now, interval)]
+                if ready:
+                    results = scrape_sources(now, workers=workers, budget=budget, sources=ready)
+                    events = _merge_events(results, now)
+                    new_events = _process_events(events, now, seen, store, post, _scraped_stores(results))
+                    SCHEDULE.observe(results, new_events, now)
+                    SCHEDULE.save()
+                    _save_caches()
+                    labels = ", ".join(label for label, _, _ in ready)
+                    print(f"[watch] {now:%H:%M} {labels}: {len(events)} events, {len(new_events)} new")
+                    SCHEDULE.report(now, interval)
+                now = londonify(datetime.now(tz=LONDON_TZ))
+                next_at = min(SCHEDULE.next_due(label, now, interval) for label, _, _ in SOURCES)
+                stop.wait(max(1.0, (next_at - now).total_seconds()))
+            print("[watch] stopping")
+            store.close()
+            OUTBOX.report()
+            _save_caches(report=True)
+    finally:
+        for sig, handler in previous.items():
+            signal.signal(sig, handler)
 
 
 def main() -> None:
+    startup = time.perf_counter() - _STARTED
     parser = argparse.ArgumentParser(description="Riftbound London Event Watcher (fixed)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help=f"Number of sources scraped in parallel (default {DEFAULT_WORKERS})")
+    parser.add_argument("--engine", choices=FETCH_ENGINES, default=None,
+                        help=f"Page fetch engine (default {FETCH_ENGINE})")
+    parser.add_argument("--max-inflight", type=int, default=None,
+                        help=f"Maximum concurrent page requests (default {MAX_INFLIGHT})")
+    parser.add_argument("--parser", choices=PARSER_BACKENDS, default=None,
+                        help=f"HTML parser backend (default {PARSER})")
+    parser.add_argument("--budget", type=float, default=None,
+                        help="Wall-clock seconds allowed for fetching (default: RIFTBOUND_BUDGET or no limit)")
+    parser.add_argument("--lock-wait", type=float, default=None,
+                        help=f"Seconds to wait for an overlapping run to finish (default {LOCK_WAIT:g})")
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="Report how long loading the script and each import took (python -X importtime for more)")
     sub = parser.add_subparsers(dest="cmd", required=True)
-    sub.add_parser("run", help="Scrape and notify (Discord webhook if set)")
+    run = sub.add_parser("run", help="Scrape the sources that are due and notify (Discord webhook if set)")
+    run.add_argument("--all-sources", action="store_true",
+                     help="Scrape every source, not just those the adaptive schedule says are due")
+    wat = sub.add_parser("watch", help="Keep running, re-scraping each source when it is due")
+    wat.add_argument("--interval", type=float, default=None,
+                     help="Fixed minutes between scrapes of a source (default: adaptive)")
     exp = sub.add_parser("export", help="Export upcoming events to .ics and/or CSV")
     exp.add_argument("--ics", dest="ics_path", default=None, help="Path to write .ics file")
     exp.add_argument("--csv", dest="csv_path", default=None, help="Path to write CSV file")
+    exp.add_argument("--from-db", action="store_true",
+                     help="Export upcoming events from the event store instead of scraping")
     args = parser.parse_args()
-    if args.cmd == "run":
-        run_once(post=True)
-    elif args.cmd == "export":
-        events = run_once(post=False)
-        if args.ics_path:
-            export_ics(events, args.ics_path)
-            print(f"Wrote {args.ics_path}")
-        if args.csv_path:
-            export_csv(events, args.csv_path)
-            print(f"Wrote {args.csv_path}")
+    try:
+        _main(args)
+    finally:
+        if args.startup_profile:
+            report_imports(startup)
+
+
+def report_imports(startup: float) -> None:
+    """Print the time spent loading this module and each top‑level and deferred import, in wall‑clock ms."""
+    print(f"[imports] module load up to main(): {startup * 1000:.1f} ms")
+    deferred = {m._name for m in LAZY_MODULES}
+    for name, seconds in sorted(IMPORT_TIMES.items(), key=lambda item: -item[1]):
+        kind = "deferred" if name in deferred else "top-level"
+        print(f"[imports] {name}: {seconds * 1000:.1f} ms ({kind})")
+    skipped = [m._name for m in LAZY_MODULES if m._name not in IMPORT_TIMES]
+    if skipped:
+        print(f"[imports] not loaded: {', '.join(skipped)}")
+
+
+def _main(args: argparse.Namespace) -> None:
+    if not (args.cmd == "export" and args.from_db):
+        configure_fetch(engine=args.engine, max_inflight=args.max_inflight, parser=args.parser)
+    try:
+        if args.cmd == "run":
+            run_once(post=True, workers=args.workers, budget=args.budget, lock_wait=args.lock_wait,
+                     all_sources=args.all_sources)
+            return
+        if args.cmd == "watch":
+            watch(interval=args.interval, workers=args.workers, budget=args.budget, lock_wait=args.lock_wait)
+            return
+        if args.from_db:
+            store = EventStore()
+            events = store.upcoming(datetime.now(tz=LONDON_TZ) - timedelta(days=1))
+            store.close()
+        else:
+            events = run_once(post=False, workers=args.workers, budget=args.budget, lock_wait=args.lock_wait,
+                              all_sources=True)
+    except StateLocked as exc:
+        print(f"[lock] {exc}; exiting")
+        return
+    if args.ics_path:
+        store = EventStore()
+        stamps = store.first_seen(events)
+        store.close()
+        export_ics(events, args.ics_path, stamps=stamps)
+        print(f"Wrote {args.ics_path}")
+    if args.csv_path:
+        export_csv(events, args.csv_path)
+        print(f"Wrote {args.csv_path}")
 
 
 if __name__ == "__main__":